@@ -0,0 +1,94 @@
+"""SQLite-backed on-disk cache for claude -p responses.
+
+run_check and extract_insights are pure functions of (prompt, model), so
+identical re-runs can skip the multi-second LLM call entirely. Entries
+are keyed by SHA-256 of the full prompt plus the model id and expire
+after 7 days.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+CACHE_FILE = Path.home() / ".ai-lint" / "cache.db"
+
+# Bump when the response schema or prompt structure changes incompatibly.
+PROMPT_VERSION = "v1"
+
+TTL_SECONDS = 7 * 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    hash TEXT PRIMARY KEY,
+    model TEXT,
+    prompt_version TEXT,
+    response TEXT,
+    created_at INTEGER,
+    expires_at INTEGER
+)
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_FILE)
+    with conn:
+        conn.execute(_SCHEMA)
+        # Reads only filter on expires_at, so without this the db would
+        # grow without bound as entries age out.
+        conn.execute(
+            "DELETE FROM llm_cache WHERE expires_at <= ?", (int(time.time()),)
+        )
+    return conn
+
+
+def cache_key(prompt: str, model: str) -> str:
+    """SHA-256 over model + prompt version + full prompt text."""
+    return hashlib.sha256(
+        f"{model}\x00{PROMPT_VERSION}\x00{prompt}".encode()
+    ).hexdigest()
+
+
+def get(prompt: str, model: str) -> dict | None:
+    """Return the cached parsed response for this prompt, or None.
+
+    Cache failures (missing/corrupt db, unreadable entry) are treated
+    as misses — the caller falls through to a real claude call.
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE hash = ? AND expires_at > ?",
+                (cache_key(prompt, model), int(time.time())),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0])
+    except json.JSONDecodeError:
+        return None
+
+
+def put(prompt: str, model: str, response: dict):
+    """Store a parsed response. Cache write failures are ignored."""
+    now = int(time.time())
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key(prompt, model),
+                    model,
+                    PROMPT_VERSION,
+                    json.dumps(response),
+                    now,
+                    now + TTL_SECONDS,
+                ),
+            )
+    except sqlite3.Error:
+        pass
@@ -1,55 +1,119 @@
 """Send transcript + policy to claude -p and parse compliance verdicts."""
 
+import asyncio
+import functools
+import io
 import json
 import re
 import shutil
 import subprocess
+from collections import Counter
+from pathlib import Path
 
+from ai_lint import _cache
 
-class ClaudeNotFoundError(RuntimeError):
-    """Raised when the claude CLI is not installed."""
+# Optional speedup: orjson decodes typical LLM JSON 2-5x faster.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so error
+# handling is shared with the stdlib fallback.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
-SYSTEM_PROMPT = """You are a compliance auditor for AI coding sessions. You will receive a session transcript and a policy document organized into sections (e.g., Security, Developer Engagement, Process Discipline).
+class ClaudeNotFoundError(RuntimeError):
+    """Raised when the claude CLI is not installed."""
 
-Evaluate each section INDEPENDENTLY. A violation in one section must not influence your judgment in another. For each rule, base your verdict only on what is visible in the transcript.
 
-Evaluation guidance:
-- For pattern-based rules (credential exposure, destructive commands): scan for specific indicators in user messages, assistant messages, and tool_use blocks (Bash, Write, Edit, Read).
-- For behavioral rules (engagement, review discipline): assess the overall conversational pattern across the session — who drives the work, how the developer responds to AI output, and whether the developer demonstrates understanding.
-- For process rules (scope, testing): look at the session arc — does it have structure, does it stay focused, are there checkpoints?
+MODEL = "claude-sonnet-4-5-20250929"
 
-Return ONLY valid JSON — no markdown fences, no commentary outside the JSON.
+_CLAUDE_ARGV = (
+    "claude", "-p", "--model", MODEL,
+    "--output-format", "json", "--no-session-persistence",
+    "--settings", '{"disableAllHooks": true}',
+)
 
-Response format:
-{
-  "verdicts": [
-    {
-      "category": "Section name",
-      "rule": "Rule name",
-      "verdict": "PASS" | "FAIL" | "SKIP",
-      "reasoning": "One sentence explanation"
-    }
-  ],
-  "summary": "One paragraph overall assessment"
-}
+_TERM_ICONS = {"PASS": "+", "FAIL": "x", "SKIP": "-"}
+_MD_ICONS = {"PASS": "✅", "FAIL": "❌", "SKIP": "⏭️"}
 
-Verdict meanings:
-- PASS: The session clearly complies with this rule.
-- FAIL: The session clearly violates this rule.
-- SKIP: The rule is not applicable to this session (e.g., no code was written, so testing rules don't apply).
+# Compiled once at import — runs on every LLM response.
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL | re.IGNORECASE)
 
-You MUST evaluate every rule in the policy. Be fair but firm."""
 
+def _extract_first_json_object(s: str) -> str | None:
+    """Return the first balanced {...} object in s, or None.
 
+    Single-pass scan tracking brace depth with string/escape awareness,
+    so braces inside JSON string values don't confuse the match. Unlike
+    a greedy regex, this ignores unbalanced trailing junk after the
+    object.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+    for i, ch in enumerate(s):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+@functools.cache
+def _system_prompt() -> str:
+    """Load the compliance system prompt (read once, then cached)."""
+    return (PROMPTS_DIR / "compliance.txt").read_text().rstrip("\n")
+
+
+@functools.cache
+def _insight_system_prompt() -> str:
+    """Load the insight system prompt (read once, then cached)."""
+    return (PROMPTS_DIR / "insights.txt").read_text().rstrip("\n")
+
+
+@functools.cache
 def check_claude_installed() -> bool:
-    """Check if the claude CLI is available."""
+    """Check if the claude CLI is available.
+
+    Memoized — the PATH walk runs once per process, not once per LLM
+    call. Use check_claude_installed.cache_clear() if the CLI could
+    have been installed mid-process.
+    """
     return shutil.which("claude") is not None
 
 
 def _call_claude(prompt: str) -> dict:
     """Send a prompt to claude -p and return parsed JSON response.
 
+    Deliberately spawns a fresh process per prompt. Reusing one
+    interactive claude process across calls would put earlier
+    transcripts into the conversation context of later audits, biasing
+    verdicts and leaking session content between checks. Startup cost
+    is instead amortized by running calls concurrently (run_check_many,
+    and check's parallel verdict/insight calls). run_check_batch
+    knowingly relaxes this isolation within a single call — see its
+    docstring for the trade-off.
+
     Raises ClaudeNotFoundError if claude CLI is not installed.
     Raises RuntimeError if claude CLI fails or response is unparseable.
     """
@@ -58,44 +122,120 @@ def _call_claude(prompt: str) -> dict:
             "'claude' CLI not found. Install Claude Code: https://claude.ai/install.sh"
         )
 
+    cached = _cache.get(prompt, MODEL)
+    if cached is not None:
+        return cached
+
     try:
         result = subprocess.run(
-            ["claude", "-p", "--model", "claude-sonnet-4-5-20250929",
-             "--output-format", "json", "--no-session-persistence",
-             "--settings", '{"disableAllHooks": true}'],
-            input=prompt,
+            _CLAUDE_ARGV,
+            input=prompt.encode("utf-8"),
             capture_output=True,
-            text=True,
             timeout=120,
         )
     except subprocess.TimeoutExpired:
         raise RuntimeError("claude -p timed out after 120 seconds")
 
     if result.returncode != 0:
-        raise RuntimeError(f"claude -p failed:\n{result.stderr}")
+        raise RuntimeError(f"claude -p failed:\n{_decode(result.stderr)}")
+
+    parsed = _parse_response(result.stdout)
+    _cache.put(prompt, MODEL, parsed)
+    return parsed
+
+
+async def _call_claude_async(prompt: str) -> dict:
+    """Async variant of _call_claude using an asyncio subprocess.
+
+    Raises ClaudeNotFoundError if claude CLI is not installed.
+    Raises RuntimeError if claude CLI fails or response is unparseable.
+    """
+    if not check_claude_installed():
+        raise ClaudeNotFoundError(
+            "'claude' CLI not found. Install Claude Code: https://claude.ai/install.sh"
+        )
 
-    raw = result.stdout.strip()
+    cached = _cache.get(prompt, MODEL)
+    if cached is not None:
+        return cached
+
+    proc = await asyncio.create_subprocess_exec(
+        *_CLAUDE_ARGV,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
     try:
-        wrapper = json.loads(raw)
-        if isinstance(wrapper, dict) and "result" in wrapper:
-            raw = wrapper["result"].strip()
-    except json.JSONDecodeError:
-        pass
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(prompt.encode()), timeout=120
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        # Reap the killed child before the event loop shuts down, or it
+        # lingers as a zombie and the transport warns at loop close.
+        await proc.wait()
+        raise RuntimeError("claude -p timed out after 120 seconds")
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"claude -p failed:\n{_decode(stderr)}")
+
+    parsed = _parse_response(stdout)
+    _cache.put(prompt, MODEL, parsed)
+    return parsed
+
+
+def _decode(data) -> str:
+    """UTF-8 decode subprocess output, passing through already-str values."""
+    if isinstance(data, (bytes, bytearray)):
+        return data.decode("utf-8", errors="replace")
+    return data
+
 
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", raw, re.DOTALL | re.IGNORECASE)
-    if fence_match:
-        raw = fence_match.group(1).strip()
+def _parse_response(raw) -> dict:
+    """Parse a claude -p response: unwrap the JSON wrapper, strip fences, load JSON.
+
+    Runs after the process exits. With --output-format json the CLI
+    buffers and emits its entire JSON in one burst at completion, so
+    incrementally parsing stdout while claude generates would overlap
+    with nothing — full-buffer parsing is both simpler and just as fast.
+
+    Raises RuntimeError if the response is unparseable.
+    """
+    raw = _decode(raw).strip()
+    # Only attempt wrapper extraction when the output can be a JSON
+    # object — skips a guaranteed-to-fail parse on fenced/prose output.
+    if raw.startswith("{"):
+        try:
+            wrapper = _json_loads(raw)
+            if isinstance(wrapper, dict) and "result" in wrapper:
+                raw = wrapper["result"].strip()
+        except json.JSONDecodeError:
+            pass
+
+    # Fast path: the whole payload is one fenced block — plain slicing
+    # beats the regex. The regex stays for embedded/partial fences.
+    stripped = None
+    if raw.startswith("```") and raw.endswith("```"):
+        newline = raw.find("\n", 0, len(raw) - 3)
+        if newline != -1:
+            stripped = raw[newline + 1:-3].strip()
+    if stripped is not None:
+        raw = stripped
+    else:
+        fence_match = _FENCE_RE.search(raw)
+        if fence_match:
+            raw = fence_match.group(1).strip()
 
     try:
-        return json.loads(raw)
+        return _json_loads(raw)
     except json.JSONDecodeError:
         pass
 
-    # Last resort: extract outermost { ... } as JSON
-    brace_match = re.search(r"\{.*\}", raw, re.DOTALL)
-    if brace_match:
+    # Last resort: extract the first balanced { ... } as JSON
+    candidate = _extract_first_json_object(raw)
+    if candidate:
         try:
-            return json.loads(brace_match.group(0))
+            return _json_loads(candidate)
         except json.JSONDecodeError:
             pass
 
@@ -104,6 +244,21 @@ def _call_claude(prompt: str) -> dict:
     )
 
 
+@functools.lru_cache(maxsize=16)
+def _compliance_prefix(policy: str) -> str:
+    """System prompt + policy prefix, cached per policy.
+
+    Sessions in one run share a single policy, so the multi-KB prefix
+    is built once instead of once per transcript.
+    """
+    return f"{_system_prompt()}\n\n---\nPOLICY:\n{policy}\n\n---\nTRANSCRIPT:\n"
+
+
+def _check_prompt(transcript: str, policy: str) -> str:
+    """Build the full compliance-check prompt for a transcript + policy pair."""
+    return _compliance_prefix(policy) + transcript
+
+
 def run_check(transcript: str, policy: str) -> dict:
     """Send transcript + policy to claude -p and return parsed verdicts.
 
@@ -111,47 +266,165 @@ def run_check(transcript: str, policy: str) -> dict:
     Raises RuntimeError if claude CLI fails.
     Returns dict with 'verdicts' and 'summary' keys.
     """
-    prompt = f"""{SYSTEM_PROMPT}
+    return _call_claude(_check_prompt(transcript, policy))
+
+
+BATCH_ADDENDUM = """
+You will receive MULTIPLE session transcripts in this request, each
+introduced by a '=== SESSION N ===' delimiter. Audit every session
+independently against the policy — verdicts for one session must not
+influence another.
+
+Instead of the single-session format above, return ONLY valid JSON of
+the form:
+{"sessions": [{"id": N, "verdicts": [...], "summary": "..."}]}
+with one entry per session, where "verdicts" and "summary" follow the
+format described above."""
+
+# Rough prompt-size budget per batched call (~4 KB heuristic per
+# transcript); oversized transcripts go in a batch of their own.
+BATCH_CHAR_BUDGET = 32000
+BATCH_MAX_SESSIONS = 8
+
+
+def _batch_prompt(transcripts: list[str], policy: str) -> str:
+    """Build one prompt auditing several numbered transcripts at once."""
+    parts = [_system_prompt(), BATCH_ADDENDUM, f"\n---\nPOLICY:\n{policy}"]
+    for i, transcript in enumerate(transcripts):
+        parts.append(f"\n=== SESSION {i} ===\n{transcript}")
+    return "\n".join(parts)
+
+
+def _split_batches(pairs: list[tuple[str, str]]) -> list[list[int]]:
+    """Group pair indices into batches under the size and count caps.
+
+    A batch never mixes policies — each batched call audits all of its
+    sessions against the one policy its prompt carries, so pairs with a
+    different policy start a new batch.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_size = 0
+    current_policy: str | None = None
+    for i, (transcript, policy) in enumerate(pairs):
+        size = len(transcript)
+        if current and (
+            policy != current_policy
+            or current_size + size > BATCH_CHAR_BUDGET
+            or len(current) >= BATCH_MAX_SESSIONS
+        ):
+            batches.append(current)
+            current = []
+            current_size = 0
+        if not current:
+            current_policy = policy
+        current.append(i)
+        current_size += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _demux_batch(raw: dict, count: int) -> list | None:
+    """Split a batched response into per-session dicts, or None on mismatch."""
+    sessions = raw.get("sessions") if isinstance(raw, dict) else None
+    if not isinstance(sessions, list):
+        return None
+    by_id = {
+        entry.get("id"): entry
+        for entry in sessions
+        if isinstance(entry, dict)
+    }
+    results = []
+    for i in range(count):
+        entry = by_id.get(i)
+        if not isinstance(entry, dict) or "verdicts" not in entry:
+            return None
+        results.append(
+            {"verdicts": entry["verdicts"], "summary": entry.get("summary", "")}
+        )
+    return results
+
+
+def run_check_batch(pairs: list[tuple[str, str]], concurrency: int = 8) -> list:
+    """Check multiple (transcript, policy) pairs, batching sessions per call.
+
+    Groups sessions into shared claude calls (amortizing prompt and
+    startup overhead), runs the batches concurrently, and demultiplexes
+    the combined responses. Batches whose response doesn't match the
+    expected schema fall back to one call per session. Returns results
+    in input order; entries are either the parsed verdicts dict or the
+    exception that check raised.
+
+    This trades some of the per-call isolation _call_claude insists on:
+    up to BATCH_MAX_SESSIONS transcripts share one model context, so
+    one session's content is visible while another is judged. The
+    BATCH_ADDENDUM instruction to audit each session independently is
+    the only mitigation — callers who need strict isolation should use
+    run_check_many instead.
+    """
+    batches = _split_batches(pairs)
+    prompts = [
+        _batch_prompt([pairs[i][0] for i in batch], pairs[batch[0]][1])
+        for batch in batches
+    ]
+
+    async def _run_all():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt):
+            async with semaphore:
+                return await _call_claude_async(prompt)
+
+        return await asyncio.gather(
+            *(_one(p) for p in prompts), return_exceptions=True
+        )
 
----
-POLICY:
-{policy}
+    raw_results = asyncio.run(_run_all()) if batches else []
+
+    results: list = [None] * len(pairs)
+    retry_singles: list[int] = []
+    for batch, raw in zip(batches, raw_results):
+        if isinstance(raw, BaseException):
+            for i in batch:
+                results[i] = raw
+            continue
+        demuxed = _demux_batch(raw, len(batch))
+        if demuxed is None:
+            retry_singles.extend(batch)
+        else:
+            for i, r in zip(batch, demuxed):
+                results[i] = r
 
----
-TRANSCRIPT:
-{transcript}"""
-    return _call_claude(prompt)
+    if retry_singles:
+        singles = run_check_many(
+            [pairs[i] for i in retry_singles], concurrency=concurrency
+        )
+        for i, r in zip(retry_singles, singles):
+            results[i] = r
 
+    return results
 
-INSIGHT_SYSTEM_PROMPT = """You are a development coach reviewing an AI coding session transcript. Your goal is to provide actionable, evidence-based feedback on how the session went.
 
-Focus on:
-- Interaction patterns: How did the developer and AI collaborate?
-- Decision quality: Were good choices made about scope, approach, and delegation?
-- Efficiency: Was time spent well? Were there unnecessary detours?
-- Process: Was there testing, review, or structured thinking?
+def run_check_many(pairs: list[tuple[str, str]], concurrency: int = 8) -> list:
+    """Run checks for multiple (transcript, policy) pairs concurrently.
 
-Every insight MUST cite specific evidence from the transcript.
+    Fires one claude subprocess per pair, at most `concurrency` in flight
+    at a time. Returns results in input order; entries are either the
+    parsed verdicts dict or the exception that check raised.
+    """
+    async def _run_all():
+        semaphore = asyncio.Semaphore(concurrency)
 
-Return ONLY valid JSON — no markdown fences, no commentary outside the JSON.
+        async def _one(transcript, policy):
+            async with semaphore:
+                return await _call_claude_async(_check_prompt(transcript, policy))
 
-Response format:
-{
-  "what_went_well": [
-    {"pattern": "Short description of positive pattern", "evidence": "Specific quote or reference from transcript"}
-  ],
-  "what_to_improve": [
-    {"pattern": "Short description of improvement area", "evidence": "Specific quote or reference from transcript"}
-  ],
-  "notable": [
-    {"observation": "Interesting observation", "evidence": "Specific quote or reference from transcript"}
-  ]
-}
+        return await asyncio.gather(
+            *(_one(t, p) for t, p in pairs), return_exceptions=True
+        )
 
-Guidelines:
-- Provide 1-3 items per section. Empty sections are fine if nothing applies.
-- Be specific and constructive, not generic.
-- Base everything on what actually happened in the transcript."""
+    return asyncio.run(_run_all())
 
 
 def extract_insights(transcript: str, policy: str) -> dict:
@@ -161,16 +434,17 @@ def extract_insights(transcript: str, policy: str) -> dict:
     Raises RuntimeError if claude CLI fails or response is unparseable.
     Returns dict with 'what_went_well', 'what_to_improve', 'notable' keys.
     """
-    prompt = f"""{INSIGHT_SYSTEM_PROMPT}
+    return _validate_insights(_call_claude(_insight_prefix(policy) + transcript))
 
----
-POLICY (for context on what the team values):
-{policy}
 
----
-TRANSCRIPT:
-{transcript}"""
-    return _validate_insights(_call_claude(prompt))
+@functools.lru_cache(maxsize=16)
+def _insight_prefix(policy: str) -> str:
+    """Insight system prompt + policy prefix, cached per policy."""
+    return (
+        f"{_insight_system_prompt()}\n\n---\n"
+        f"POLICY (for context on what the team values):\n{policy}\n\n---\n"
+        f"TRANSCRIPT:\n"
+    )
 
 
 def _validate_insights(raw: dict) -> dict:
@@ -230,42 +504,55 @@ def format_insights(insights: dict) -> str:
     return "\n".join(lines)
 
 
-def _group_by_category(verdicts: list[dict]) -> list[tuple[str, list[dict]]]:
-    """Group verdicts by category, preserving order of first appearance."""
+def _summarize(verdicts: list[dict]) -> tuple[list[tuple[str, list[dict]]], dict[str, int]]:
+    """Group verdicts by category and count them in a single pass.
+
+    Returns (groups, counts) where groups preserves first-appearance
+    category order and counts matches the count_verdicts format.
+    """
     groups: dict[str, list[dict]] = {}
+    counts = {"pass": 0, "fail": 0, "skip": 0}
     for v in verdicts:
+        key = v["verdict"].lower()
+        if key in counts:
+            counts[key] += 1
         cat = v.get("category", "General")
-        groups.setdefault(cat, []).append(v)
-    return list(groups.items())
+        group = groups.get(cat)
+        if group is None:
+            groups[cat] = [v]
+        else:
+            group.append(v)
+    return list(groups.items()), counts
 
 
 def count_verdicts(verdicts: list[dict]) -> dict[str, int]:
     """Count verdicts by type, returning {"pass": N, "fail": N, "skip": N}."""
+    counts = Counter(v["verdict"] for v in verdicts)
     return {
-        "pass": sum(1 for v in verdicts if v["verdict"] == "PASS"),
-        "fail": sum(1 for v in verdicts if v["verdict"] == "FAIL"),
-        "skip": sum(1 for v in verdicts if v["verdict"] == "SKIP"),
+        "pass": counts.get("PASS", 0),
+        "fail": counts.get("FAIL", 0),
+        "skip": counts.get("SKIP", 0),
     }
 
 
 def format_verdicts(result: dict) -> str:
     """Format verdicts dict into a readable terminal string."""
-    lines = []
+    buf = io.StringIO()
     verdicts = result.get("verdicts", [])
     counts = count_verdicts(verdicts)
     total = counts["pass"] + counts["fail"] + counts["skip"]
 
     for v in verdicts:
-        icon = {"PASS": "+", "FAIL": "x", "SKIP": "-"}.get(v["verdict"], "?")
-        if v["verdict"] == "FAIL":
-            lines.append(f"  [{icon}] {v['verdict']}: {v['rule']} — {v['reasoning']}")
+        verdict = v["verdict"]
+        icon = _TERM_ICONS.get(verdict, "?")
+        if verdict == "FAIL":
+            buf.write(f"  [{icon}] {verdict}: {v['rule']} — {v['reasoning']}\n")
         else:
-            lines.append(f"  [{icon}] {v['verdict']}: {v['rule']}")
+            buf.write(f"  [{icon}] {verdict}: {v['rule']}\n")
 
-    lines.append("")
-    lines.append(f"  {counts['pass']}/{total} passed")
+    buf.write(f"\n  {counts['pass']}/{total} passed")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_report_markdown(session_results: list[dict]) -> str:
@@ -275,7 +562,24 @@ def format_report_markdown(session_results: list[dict]) -> str:
       - session_label: str
       - result: dict (the verdicts dict from run_check)
     """
-    lines = ["# ai-lint Compliance Report", ""]
+    buf = io.StringIO()
+    _render_report(session_results, buf)
+    return buf.getvalue()
+
+
+def write_report_markdown(session_results: list[dict], path):
+    """Render the markdown report directly into a file.
+
+    Streams to disk instead of materializing the whole report string —
+    preferable for large multi-session reports.
+    """
+    with open(path, "w") as f:
+        _render_report(session_results, f)
+
+
+def _render_report(session_results: list[dict], buf):
+    """Write the markdown report for session_results to a text stream."""
+    buf.write("# ai-lint Compliance Report\n\n")
 
     total_pass = 0
     total_fail = 0
@@ -285,39 +589,30 @@ def format_report_markdown(session_results: list[dict]) -> str:
         label = entry["session_label"]
         result = entry["result"]
         verdicts = result.get("verdicts", [])
-        counts = count_verdicts(verdicts)
+        groups, counts = _summarize(verdicts)
 
-        lines.append(f"## {label}")
-        lines.append("")
+        buf.write(f"## {label}\n\n")
 
-        for category, group in _group_by_category(verdicts):
-            lines.append(f"### {category}")
-            lines.append("")
+        for category, group in groups:
+            buf.write(f"### {category}\n\n")
             for v in group:
-                icon = {"PASS": "✅", "FAIL": "❌", "SKIP": "⏭️"}.get(v["verdict"], "❓")
-                lines.append(f"- {icon} **{v['verdict']}**: {v['rule']}")
-                lines.append(f"  - {v['reasoning']}")
-            lines.append("")
+                verdict = v["verdict"]
+                icon = _MD_ICONS.get(verdict, "❓")
+                buf.write(f"- {icon} **{verdict}**: {v['rule']}\n  - {v['reasoning']}\n")
+            buf.write("\n")
 
         total_pass += counts["pass"]
         total_fail += counts["fail"]
         total_skip += counts["skip"]
 
-        lines.append("")
-        lines.append(f"**Score: {counts['pass']} passed, {counts['fail']} failed, {counts['skip']} skipped**")
-        lines.append("")
+        buf.write(f"\n**Score: {counts['pass']} passed, {counts['fail']} failed, {counts['skip']} skipped**\n\n")
 
         summary = result.get("summary", "")
         if summary:
-            lines.append(f"> {summary}")
-            lines.append("")
+            buf.write(f"> {summary}\n\n")
 
-        lines.append("---")
-        lines.append("")
+        buf.write("---\n\n")
 
-    lines.append("## Overall")
-    lines.append(f"- Sessions checked: {len(session_results)}")
-    lines.append(f"- Total: {total_pass} passed, {total_fail} failed, {total_skip} skipped")
-    lines.append("")
-
-    return "\n".join(lines)
+    buf.write("## Overall\n")
+    buf.write(f"- Sessions checked: {len(session_results)}\n")
+    buf.write(f"- Total: {total_pass} passed, {total_fail} failed, {total_skip} skipped\n")
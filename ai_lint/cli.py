@@ -1,39 +1,81 @@
 """Click CLI for ai-lint."""
 
+import importlib
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from pathlib import Path
 
 import click
 
-from ai_lint.checker import (
-    ClaudeNotFoundError,
-    check_claude_installed,
-    count_verdicts,
-    extract_insights,
-    format_insights,
-    format_report_markdown,
-    format_verdicts,
-    run_check,
-)
-from ai_lint.config import (
-    PERSONAS,
-    install_policy,
-    open_policy_in_editor,
-    policy_exists,
-    read_policy,
-)
-from ai_lint.sessions import (
-    discover_sessions,
-    format_transcript,
-    parse_session,
-)
-from ai_lint.setup_hook import install_hook, is_hook_installed
-from ai_lint.spinner import Spinner
-
-
-@click.group()
+# The ai_lint modules these names come from are only imported when a
+# command actually runs (see LazyCommandGroup), so `ai-lint --help` and
+# `--version` pay for click alone. Tests monkeypatch these names on
+# this module; _load_deps never overwrites a name that is already set.
+_LAZY_IMPORTS = {
+    "ai_lint.checker": (
+        "ClaudeNotFoundError",
+        "check_claude_installed",
+        "count_verdicts",
+        "extract_insights",
+        "format_insights",
+        "format_verdicts",
+        "run_check",
+        "run_check_batch",
+        "write_report_markdown",
+    ),
+    "ai_lint.config": (
+        "PERSONAS",
+        "install_policy",
+        "open_policy_in_editor",
+        "policy_exists",
+        "read_policy",
+    ),
+    "ai_lint.sessions": (
+        "discover_sessions",
+        "filter_user_sessions",
+        "format_transcript",
+        "parse_session",
+    ),
+    "ai_lint.setup_hook": ("install_hook", "is_hook_installed"),
+    "ai_lint.spinner": ("Spinner",),
+}
+
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+
+def __getattr__(name):
+    """Resolve lazy names on module-attribute access (PEP 562)."""
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _load_deps():
+    """Populate command dependencies into module globals on dispatch.
+
+    setdefault keeps any name a test has already monkeypatched.
+    """
+    g = globals()
+    for module_name, names in _LAZY_IMPORTS.items():
+        if all(name in g for name in names):
+            continue
+        module = importlib.import_module(module_name)
+        for name in names:
+            g.setdefault(name, getattr(module, name))
+
+
+class LazyCommandGroup(click.Group):
+    """Group that defers importing command dependencies until dispatch."""
+
+    def invoke(self, ctx):
+        _load_deps()
+        return super().invoke(ctx)
+
+
+@click.group(cls=LazyCommandGroup)
 @click.version_option(package_name="ai-lint")
 def cli():
     """ai-lint: Check AI coding sessions against your own rules."""
@@ -89,6 +131,36 @@ def init():
     click.echo("\nDone! Run 'ai-lint check' to check a session, or 'ai-lint policy' to edit your rules.")
 
 
+def _run_checks(transcript, policy, with_insights):
+    """Run the compliance check, optionally with insights in parallel.
+
+    Returns (result, insights). Rather than spinning up a pool for two
+    tasks, the insight call runs on one spare thread while the verdict
+    check runs right here. Verdict errors propagate; insight failures
+    degrade to None.
+    """
+    if not with_insights:
+        return run_check(transcript, policy), None
+
+    import threading
+
+    box = {}
+
+    def _insights():
+        try:
+            box["insights"] = extract_insights(transcript, policy)
+        except Exception:
+            box["insights"] = None
+
+    t = threading.Thread(target=_insights, daemon=True)
+    t.start()
+    try:
+        result = run_check(transcript, policy)
+    finally:
+        t.join()
+    return result, box.get("insights")
+
+
 def _echo(message, tty_file=None):
     """Write message to tty_file if provided, otherwise click.echo."""
     if tty_file:
@@ -105,6 +177,8 @@ def _echo(message, tty_file=None):
 @click.option("--tty", is_flag=True, hidden=True, help="Write output to /dev/tty (for hook usage).")
 def check(last, quiet, no_insights, tty):
     """Pick a session and check it against your policy."""
+    from concurrent.futures import ThreadPoolExecutor
+
     # When --tty, write directly to the terminal so output is visible from hooks.
     tty_file = None
     if tty:
@@ -118,19 +192,21 @@ def check(last, quiet, no_insights, tty):
         sys.exit(1)
 
     sessions = discover_sessions()
-    if not sessions:
+    # Classify only as many sessions as we're going to show or pick.
+    candidates = filter_user_sessions(sessions, limit=1 if last else 20)
+    if not candidates:
         _echo("No sessions found in ~/.claude/projects/", tty_file)
         sys.exit(1)
 
     if last:
-        selected = sessions[0]  # already sorted most recent first
+        selected = candidates[0]  # already sorted most recent first
     else:
-        # Parse just enough to build labels
-        for s in sessions[:20]:
-            parse_session(s, max_messages=3)
+        # Parse just enough to build labels, overlapping the file reads
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda s: parse_session(s, max_messages=3), candidates))
 
         click.echo("Recent sessions:\n")
-        display = sessions[:20]
+        display = candidates
         for i, s in enumerate(display, 1):
             click.echo(f"  {i:>2}. {s.label}")
         click.echo()
@@ -163,32 +239,10 @@ def check(last, quiet, no_insights, tty):
         if quiet:
             # Run silently — no spinner, no "getting ready" message.
             # Results print once they're done.
-            if skip_insights:
-                result = run_check(transcript, policy)
-                insights = None
-            else:
-                with ThreadPoolExecutor(max_workers=2) as pool:
-                    verdict_future = pool.submit(run_check, transcript, policy)
-                    insight_future = pool.submit(extract_insights, transcript, policy)
-                    result = verdict_future.result()
-                    try:
-                        insights = insight_future.result()
-                    except Exception:
-                        insights = None
+            result, insights = _run_checks(transcript, policy, not skip_insights)
         else:
             with Spinner("Analyzing with claude..."):
-                if skip_insights:
-                    result = run_check(transcript, policy)
-                    insights = None
-                else:
-                    with ThreadPoolExecutor(max_workers=2) as pool:
-                        verdict_future = pool.submit(run_check, transcript, policy)
-                        insight_future = pool.submit(extract_insights, transcript, policy)
-                        result = verdict_future.result()
-                        try:
-                            insights = insight_future.result()
-                        except Exception:
-                            insights = None
+                result, insights = _run_checks(transcript, policy, not skip_insights)
     except (ClaudeNotFoundError, RuntimeError) as e:
         _echo(f"Error: {e}", tty_file)
         sys.exit(1)
@@ -230,29 +284,37 @@ def report(count, outfile):
         sys.exit(1)
 
     sessions = discover_sessions()
-    if not sessions:
+    to_check = filter_user_sessions(sessions, limit=count)
+    if not to_check:
         click.echo("No sessions found in ~/.claude/projects/")
         sys.exit(1)
 
-    to_check = sessions[:count]
     policy = read_policy()
-    session_results = []
 
-    for i, s in enumerate(to_check, 1):
-        parse_session(s)
-        if not s.messages:
-            continue
-        transcript = format_transcript(s)
-        try:
-            with Spinner(f"[{i}/{len(to_check)}] Checking {s.label}..."):
-                result = run_check(transcript, policy)
-        except (ClaudeNotFoundError, RuntimeError) as e:
-            click.echo(f"  Error: {e}", err=True)
+    # Parsing is file I/O bound — overlap it across sessions. Four
+    # workers is plenty; the LLM calls afterwards dominate anyway.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(4, len(to_check))) as pool:
+        list(pool.map(parse_session, to_check))
+    checkable = [s for s in to_check if s.messages]
+
+    pairs = [(format_transcript(s), policy) for s in checkable]
+    results = []
+    if pairs:
+        with Spinner(f"Checking {len(pairs)} session(s) with claude..."):
+            results = run_check_batch(pairs)
+
+    session_results = []
+    for s, result in zip(checkable, results):
+        if isinstance(result, BaseException):
+            click.echo(f"  Error: {result}", err=True)
             continue
         session_results.append({"session_label": s.label, "result": result})
 
         # Show inline summary
         counts = count_verdicts(result.get("verdicts", []))
+        click.echo(f"  {s.label}")
         click.echo(f"  -> {counts['pass']} passed, {counts['fail']} failed")
 
     if not session_results:
@@ -270,14 +332,15 @@ def report(count, outfile):
     else:
         click.echo(f"Found {total_fail} total violation(s) across sessions.")
 
-    # Export markdown
-    md = format_report_markdown(session_results)
+    # Export markdown, streaming straight to the file
     if outfile:
-        Path(outfile).write_text(md)
+        write_report_markdown(session_results, outfile)
         click.echo(f"\nReport saved to {outfile}")
     else:
+        from datetime import datetime
+
         default_name = f"ai-lint-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
-        Path(default_name).write_text(md)
+        write_report_markdown(session_results, default_name)
         click.echo(f"\nReport saved to {default_name}")
 
 
@@ -1,7 +1,7 @@
 """Manage ~/.ai-lint/ configuration directory and policy.md file."""
 
+import functools
 import os
-import shutil
 from pathlib import Path
 
 CONFIG_DIR = Path.home() / ".ai-lint"
@@ -19,8 +19,22 @@ def ensure_config_dir():
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Only positive results are cached: once a policy exists it doesn't
+# disappear mid-process, but a missing one can appear (init).
+_policy_exists_cache: bool | None = None
+
+
 def policy_exists() -> bool:
-    return POLICY_FILE.exists()
+    global _policy_exists_cache
+    if _policy_exists_cache is not True:
+        _policy_exists_cache = POLICY_FILE.exists()
+    return _policy_exists_cache
+
+
+@functools.lru_cache(maxsize=None)
+def _template_bytes(persona: str) -> bytes:
+    """Read a persona's template once; templates ship with the package and never change."""
+    return (TEMPLATES_DIR / PERSONAS[persona]).read_bytes()
 
 
 def install_policy(persona: str):
@@ -28,8 +42,9 @@ def install_policy(persona: str):
     if persona not in PERSONAS:
         raise ValueError(f"Unknown persona: {persona}. Choose from: {list(PERSONAS.keys())}")
     ensure_config_dir()
-    template = TEMPLATES_DIR / PERSONAS[persona]
-    shutil.copy2(template, POLICY_FILE)
+    POLICY_FILE.write_bytes(_template_bytes(persona))
+    global _policy_exists_cache
+    _policy_exists_cache = True
 
 
 def read_policy() -> str:
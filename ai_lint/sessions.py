@@ -1,10 +1,21 @@
 """Find and parse Claude Code session JSONL transcripts."""
 
+import atexit
+import io
 import json
+import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
 
+try:  # optional speedup: pip install ai-lint[speed]
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 
 # Prompt prefixes used by ai-lint's own claude -p calls (checker.py).
@@ -30,10 +41,16 @@ class Session:
     cwd: str = ""
     timestamp: str = ""
     messages: list[Message] = field(default_factory=list)
+    is_ailint: bool | None = None  # None = not yet classified
 
-    @property
+    @cached_property
     def label(self) -> str:
-        """Human-readable label for session picker."""
+        """Human-readable label for session picker.
+
+        Cached after first access — the timestamp parse and string
+        slicing don't need repeating. Computed only after the session
+        has been parsed far enough to have its first message.
+        """
         time_str = ""
         if self.timestamp:
             try:
@@ -57,12 +74,84 @@ class Session:
         return " | ".join(parts) if parts else self.session_id
 
 
+# Persistent classification cache: {path: [mtime, size, is_ailint]}.
+# Transcripts are append-only, so (mtime, size) staleness checks make
+# repeat `ai-lint check` runs stat files instead of re-parsing them.
+CLASSIFY_CACHE_FILE = Path.home() / ".ai-lint" / "classify_cache.json"
+
+_classify_cache: dict | None = None
+_classify_cache_dirty = False
+
+
+def _classify_entries() -> dict:
+    """Load the persisted classification cache on first use."""
+    global _classify_cache
+    if _classify_cache is None:
+        try:
+            with open(CLASSIFY_CACHE_FILE, "r") as f:
+                _classify_cache = json.load(f)
+        except (OSError, ValueError):
+            _classify_cache = {}
+        atexit.register(_flush_classify_cache)
+    return _classify_cache
+
+
+def _flush_classify_cache() -> None:
+    """Write the classification cache back to disk if it changed."""
+    global _classify_cache_dirty
+    if not _classify_cache_dirty or _classify_cache is None:
+        return
+    try:
+        CLASSIFY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CLASSIFY_CACHE_FILE.write_text(json.dumps(_classify_cache))
+        _classify_cache_dirty = False
+    except OSError:
+        pass
+
+
 def _is_ai_lint_session(path: Path) -> bool:
     """Check if a JSONL session file is an ai-lint internal session.
 
-    Reads the first user message and checks if it starts with a known
-    ai-lint prompt prefix (compliance check or insights extraction).
+    The verdict is memoized on (mtime, size) in CLASSIFY_CACHE_FILE so
+    repeat runs only stat the file instead of re-reading it.
     """
+    global _classify_cache_dirty
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    cache = _classify_entries()
+    key = str(path)
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime and hit[1] == st.st_size:
+        return hit[2]
+    result = _classify_session(path)
+    cache[key] = [st.st_mtime, st.st_size, result]
+    _classify_cache_dirty = True
+    return result
+
+
+# The prefixes contain no characters JSON escapes, so they appear
+# verbatim in the raw JSONL bytes — a substring scan can rule a file
+# out without parsing any JSON.
+_PREFIX_NEEDLES = tuple(p.encode() for p in _AI_LINT_PROMPT_PREFIXES)
+_SNIFF_BYTES = 65536
+
+
+def _classify_session(path: Path) -> bool:
+    """Read the first user message and match known ai-lint prompt prefixes."""
+    # Fast negative: if no prefix appears in the head of the file, it
+    # can't be an ai-lint session. A hit (or a >64 KiB first line) still
+    # goes through the precise JSON parse below to avoid false positives
+    # from the prefix text merely being quoted in a user message.
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        return False
+    if len(head) < _SNIFF_BYTES and not any(n in head for n in _PREFIX_NEEDLES):
+        return False
+
     try:
         with open(path, "r") as f:
             for line in f:
@@ -85,7 +174,8 @@ def _is_ai_lint_session(path: Path) -> bool:
                     else:
                         return False
                 if isinstance(content, str):
-                    return any(content.startswith(prefix) for prefix in _AI_LINT_PROMPT_PREFIXES)
+                    # startswith accepts the prefix tuple natively
+                    return content.startswith(_AI_LINT_PROMPT_PREFIXES)
                 return False
     except (OSError, ValueError):
         return False
@@ -97,58 +187,86 @@ def discover_sessions() -> list[Session]:
     if not CLAUDE_PROJECTS_DIR.exists():
         return []
 
-    sessions = []
-    for jsonl_path in sorted(CLAUDE_PROJECTS_DIR.rglob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True):
+    # Single scandir pass per directory: DirEntry caches the stat from
+    # readdir, so sorting by mtime costs no extra syscall per file.
+    entries = []
+    for proj in os.scandir(CLAUDE_PROJECTS_DIR):
         # Skip subagent transcripts
-        if "subagents" in jsonl_path.parts:
-            continue
-        # Skip ai-lint's own claude -p sessions
-        if _is_ai_lint_session(jsonl_path):
+        if not proj.is_dir(follow_symlinks=False) or proj.name == "subagents":
             continue
-        # Project name from parent directory
-        project_dir = jsonl_path.parent.name
-        session_id = jsonl_path.stem
+        for entry in os.scandir(proj.path):
+            if not entry.name.endswith(".jsonl") or not entry.is_file(follow_symlinks=False):
+                continue
+            entries.append((entry.stat().st_mtime, entry.path, proj.name))
+    entries.sort(reverse=True)
+
+    sessions = []
+    for _mtime, path_str, project_dir in entries:
+        jsonl_path = Path(path_str)
         sessions.append(Session(
-            session_id=session_id,
+            session_id=jsonl_path.stem,
             path=jsonl_path,
             project=project_dir,
         ))
     return sessions
 
 
+def filter_user_sessions(sessions: list[Session], limit: int | None = None) -> list[Session]:
+    """Return up to `limit` sessions that are real user work.
+
+    Classifying a session (see _is_ai_lint_session) means opening and
+    parsing its transcript, so it happens here — lazily, and only until
+    enough user sessions are found — rather than for every file during
+    discovery. The result is cached on the Session.
+    """
+    out = []
+    for session in sessions:
+        if limit is not None and len(out) >= limit:
+            break
+        if session.is_ailint is None:
+            session.is_ailint = _is_ai_lint_session(session.path)
+        if not session.is_ailint:
+            out.append(session)
+    return out
+
+
+# Concise one-line summaries for known tool_use blocks; unknown tools
+# fall back to a bare "[Tool: name]" marker.
+_TOOL_FMT = {
+    "Bash": lambda inp: f"[Tool: Bash] {inp.get('command', '')}",
+    "Read": lambda inp: f"[Tool: Read] {inp.get('file_path', '')}",
+    "Write": lambda inp: f"[Tool: Write] {inp.get('file_path', '')}",
+    "Edit": lambda inp: f"[Tool: Edit] {inp.get('file_path', '')}",
+    "Grep": lambda inp: f"[Tool: Grep] pattern={inp.get('pattern', '')}",
+    "Glob": lambda inp: f"[Tool: Glob] {inp.get('pattern', '')}",
+}
+
+
 def _extract_text(content) -> str:
     """Extract readable text from message content (string or list of blocks)."""
     if isinstance(content, str):
         return content
     if isinstance(content, list):
         parts = []
+        append = parts.append
         for block in content:
             if isinstance(block, dict):
-                if block.get("type") == "text":
-                    parts.append(block["text"])
-                elif block.get("type") == "tool_use":
+                btype = block.get("type")
+                if btype == "text":
+                    append(block["text"])
+                elif btype == "tool_use":
                     tool = block.get("name", "unknown")
-                    inp = block.get("input", {})
-                    # Summarize tool use concisely
-                    if tool == "Bash":
-                        parts.append(f"[Tool: Bash] {inp.get('command', '')}")
-                    elif tool in ("Read", "Write", "Edit"):
-                        parts.append(f"[Tool: {tool}] {inp.get('file_path', '')}")
-                    elif tool == "Grep":
-                        parts.append(f"[Tool: Grep] pattern={inp.get('pattern', '')}")
-                    elif tool == "Glob":
-                        parts.append(f"[Tool: Glob] {inp.get('pattern', '')}")
-                    else:
-                        parts.append(f"[Tool: {tool}]")
-                elif block.get("type") == "tool_result":
+                    fmt = _TOOL_FMT.get(tool)
+                    append(fmt(block.get("input", {})) if fmt else f"[Tool: {tool}]")
+                elif btype == "tool_result":
                     result_content = block.get("content", "")
                     if isinstance(result_content, str) and result_content:
                         # Truncate long tool results
                         if len(result_content) > 500:
                             result_content = result_content[:500] + "... (truncated)"
-                        parts.append(f"[Tool Result] {result_content}")
+                        append(f"[Tool Result] {result_content}")
             elif isinstance(block, str):
-                parts.append(block)
+                append(block)
         return "\n".join(parts)
     return str(content)
 
@@ -159,14 +277,14 @@ def parse_session(session: Session, max_messages: int = 200) -> Session:
     first_timestamp = None
     cwd = ""
 
-    with open(session.path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    with open(session.path, "rb") as f:
+        append = messages.append
+        for raw in f:
+            # Both json and orjson accept bytes and tolerate surrounding
+            # whitespace; blank lines fall into the except below.
             try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
+                entry = _json_loads(raw)
+            except ValueError:
                 continue
 
             entry_type = entry.get("type")
@@ -200,7 +318,14 @@ def parse_session(session: Session, max_messages: int = 200) -> Session:
             if first_timestamp is None:
                 first_timestamp = timestamp
 
-            messages.append(Message(role=role, text=text, timestamp=timestamp))
+            # Same pass, two answers: the first user message also tells
+            # us whether this is one of ai-lint's own claude -p
+            # sessions, so a later filter_user_sessions pass doesn't
+            # have to reopen the file.
+            if session.is_ailint is None and role == "user":
+                session.is_ailint = text.startswith(_AI_LINT_PROMPT_PREFIXES)
+
+            append(Message(role=role, text=text, timestamp=timestamp))
 
             if len(messages) >= max_messages:
                 break
@@ -213,20 +338,19 @@ def parse_session(session: Session, max_messages: int = 200) -> Session:
 
 def format_transcript(session: Session) -> str:
     """Format a parsed session into a readable transcript string."""
-    lines = []
-    lines.append(f"# Session: {session.session_id}")
-    lines.append(f"Project: {session.project}")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Session: {session.session_id}\n")
+    w(f"Project: {session.project}\n")
     if session.cwd:
-        lines.append(f"Working directory: {session.cwd}")
+        w(f"Working directory: {session.cwd}\n")
     if session.timestamp:
-        lines.append(f"Started: {session.timestamp}")
-    lines.append(f"Messages: {len(session.messages)}")
-    lines.append("")
+        w(f"Started: {session.timestamp}\n")
+    w(f"Messages: {len(session.messages)}\n")
 
     for msg in session.messages:
-        role_label = "USER" if msg.role == "user" else "ASSISTANT"
-        lines.append(f"--- {role_label} ---")
-        lines.append(msg.text)
-        lines.append("")
+        w("\n--- USER ---\n" if msg.role == "user" else "\n--- ASSISTANT ---\n")
+        w(msg.text)
+        w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
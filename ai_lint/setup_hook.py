@@ -4,6 +4,11 @@ import json
 import sys
 from pathlib import Path
 
+try:  # optional speedup: pip install ai-lint[speed]
+    import orjson
+except ImportError:
+    orjson = None
+
 CLAUDE_SETTINGS = Path.home() / ".claude" / "settings.json"
 
 HOOK_COMMAND = "ai-lint check --last --quiet"
@@ -30,7 +35,10 @@ def read_settings() -> dict:
 
 def write_settings(settings: dict):
     CLAUDE_SETTINGS.parent.mkdir(parents=True, exist_ok=True)
-    CLAUDE_SETTINGS.write_text(json.dumps(settings, indent=2) + "\n")
+    if orjson is not None:
+        CLAUDE_SETTINGS.write_bytes(orjson.dumps(settings, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        CLAUDE_SETTINGS.write_text(json.dumps(settings, indent=2) + "\n")
 
 
 def _is_ailint_hook(command: str) -> bool:
@@ -79,15 +87,19 @@ def install_hook():
 
 def uninstall_hook():
     """Remove the ai-lint SessionEnd hook from Claude settings."""
-    if not is_hook_installed():
-        print("ai-lint hook is not installed.")
-        return
-
+    # One read-parse-mutate-write cycle; whether the hook was installed
+    # falls out of the filter instead of a separate is_hook_installed
+    # call that would read and parse the settings a second time.
     settings = read_settings()
     session_end = settings.get("hooks", {}).get("SessionEnd", [])
-    settings["hooks"]["SessionEnd"] = [
+    kept = [
         entry for entry in session_end
         if not any(_is_ailint_hook(h.get("command", "")) for h in entry.get("hooks", []))
     ]
+    if len(kept) == len(session_end):
+        print("ai-lint hook is not installed.")
+        return
+
+    settings["hooks"]["SessionEnd"] = kept
     write_settings(settings)
     print("Removed ai-lint SessionEnd hook.")
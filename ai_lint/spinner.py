@@ -15,23 +15,30 @@ class Spinner:
         self.message = message
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
+        # Render each frame line once instead of per redraw
+        self._rendered = [f"\r{frame} {message}" for frame in self._FRAMES]
 
     def _spin(self):
-        for frame in itertools.cycle(self._FRAMES):
+        for frame in itertools.cycle(self._rendered):
             if self._stop.is_set():
                 break
-            sys.stderr.write(f"\r{frame} {self.message}")
+            sys.stderr.write(frame)
             sys.stderr.flush()
-            time.sleep(0.08)
+            time.sleep(0.1)
 
     def __enter__(self):
+        # No TTY means nobody is watching — don't spam redraws into a
+        # log file or pipe.
+        if not sys.stderr.isatty():
+            return self
         self._thread = threading.Thread(target=self._spin, daemon=True)
         self._thread.start()
         return self
 
     def __exit__(self, *exc):
+        if self._thread is None:
+            return
         self._stop.set()
-        if self._thread:
-            self._thread.join()
+        self._thread.join()
         sys.stderr.write("\r" + " " * (len(self.message) + 4) + "\r")
         sys.stderr.flush()
@@ -1,13 +1,42 @@
 """Shared fixtures for ai-lint tests."""
 
 import json
-import shutil
 import types
 from pathlib import Path
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the LLM response cache out of the real home directory."""
+    monkeypatch.setattr("ai_lint._cache.CACHE_FILE", tmp_path / "cache.db")
+
+
+@pytest.fixture(autouse=True)
+def isolated_classify_cache(tmp_path, monkeypatch):
+    """Keep the session classification cache out of the real home directory."""
+    monkeypatch.setattr("ai_lint.sessions.CLASSIFY_CACHE_FILE", tmp_path / "classify_cache.json")
+    monkeypatch.setattr("ai_lint.sessions._classify_cache", None)
+    monkeypatch.setattr("ai_lint.sessions._classify_cache_dirty", False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_claude_check():
+    """Reset the memoized claude-installed check between tests."""
+    from ai_lint.checker import check_claude_installed
+
+    check_claude_installed.cache_clear()
+    yield
+    check_claude_installed.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_policy_cache(monkeypatch):
+    """Reset the cached policy_exists verdict between tests."""
+    monkeypatch.setattr("ai_lint.config._policy_exists_cache", None)
+
+
 @pytest.fixture()
 def config_dir(tmp_path, monkeypatch):
     """Point CONFIG_DIR and POLICY_FILE at a temp directory."""
@@ -18,12 +47,19 @@ def config_dir(tmp_path, monkeypatch):
     return d
 
 
-@pytest.fixture()
-def installed_policy(config_dir):
-    """Copy the 'self' policy template into the config dir."""
+@pytest.fixture(scope="session")
+def _policy_template_text():
+    """Read the 'self' policy template once per session."""
     templates = Path(__file__).resolve().parent.parent / "ai_lint" / "templates"
-    shutil.copy2(templates / "policy_self.md", config_dir / "policy.md")
-    return config_dir / "policy.md"
+    return (templates / "policy_self.md").read_text()
+
+
+@pytest.fixture()
+def installed_policy(config_dir, _policy_template_text):
+    """Write the 'self' policy template into the config dir."""
+    policy = config_dir / "policy.md"
+    policy.write_text(_policy_template_text)
+    return policy
 
 
 @pytest.fixture()
@@ -44,13 +80,9 @@ def claude_settings_dir(tmp_path, monkeypatch):
     return settings_file
 
 
-@pytest.fixture()
-def sample_jsonl_session(claude_projects_dir):
-    """Create a realistic session JSONL file and return its path."""
-    project_dir = claude_projects_dir / "-Users-dev-myproject"
-    project_dir.mkdir()
-    session_file = project_dir / "abc12345-1111-2222-3333-444444444444.jsonl"
-
+@pytest.fixture(scope="session")
+def _sample_session_bytes():
+    """Serialize the sample session entries once per session."""
     entries = [
         {
             "type": "user",
@@ -105,14 +137,25 @@ def sample_jsonl_session(claude_projects_dir):
         },
     ]
 
-    lines = [json.dumps(e) for e in entries]
-    session_file.write_text("\n".join(lines) + "\n")
-    return session_file
+    return ("\n".join(json.dumps(e) for e in entries) + "\n").encode()
 
 
 @pytest.fixture()
+def sample_jsonl_session(claude_projects_dir, _sample_session_bytes):
+    """Create a realistic session JSONL file and return its path."""
+    project_dir = claude_projects_dir / "-Users-dev-myproject"
+    project_dir.mkdir()
+    session_file = project_dir / "abc12345-1111-2222-3333-444444444444.jsonl"
+    session_file.write_bytes(_sample_session_bytes)
+    return session_file
+
+
+@pytest.fixture(scope="session")
 def sample_verdicts():
-    """Return a dict matching the run_check output format."""
+    """Return a dict matching the run_check output format.
+
+    Session-scoped and shared — tests only read it, never mutate.
+    """
     return {
         "verdicts": [
             {"category": "Security", "rule": "No credential exposure", "verdict": "PASS", "reasoning": "No secrets found."},
@@ -126,6 +169,12 @@ def sample_verdicts():
 
 
 @pytest.fixture()
+def claude_installed(monkeypatch):
+    """Stub check_claude_installed to report the claude CLI as present."""
+    monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
+
+
+@pytest.fixture(scope="session")
 def make_fake_result():
     """Factory fixture for creating fake subprocess results."""
     def _make(returncode=0, stdout="", stderr=""):
@@ -133,9 +182,12 @@ def make_fake_result():
     return _make
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_insights():
-    """Return a dict matching the extract_insights output format."""
+    """Return a dict matching the extract_insights output format.
+
+    Session-scoped and shared — tests only read it, never mutate.
+    """
     return {
         "what_went_well": [
             {"pattern": "Clear problem description", "evidence": "User described expected vs actual behavior"},
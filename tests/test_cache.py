@@ -0,0 +1,95 @@
+"""Tests for ai_lint._cache."""
+
+import pytest
+
+from ai_lint import _cache
+from ai_lint._cache import cache_key, get, put
+
+# The payload is fixed, so skip re-serializing it per test.
+SIMPLE_PAYLOAD = {"key": "value"}
+SIMPLE_JSON = '{"key": "value"}'
+
+
+class TestCacheKey:
+    def test_stable(self):
+        assert cache_key("prompt", "model") == cache_key("prompt", "model")
+
+    def test_varies_with_prompt(self):
+        assert cache_key("prompt a", "model") != cache_key("prompt b", "model")
+
+    def test_varies_with_model(self):
+        assert cache_key("prompt", "model-a") != cache_key("prompt", "model-b")
+
+
+class TestGetPut:
+    def test_miss_returns_none(self):
+        assert get("never stored", "model") is None
+
+    def test_roundtrip(self):
+        response = {"verdicts": [], "summary": "ok"}
+        put("prompt", "model", response)
+        assert get("prompt", "model") == response
+
+    def test_overwrite(self):
+        put("prompt", "model", {"summary": "first"})
+        put("prompt", "model", {"summary": "second"})
+        assert get("prompt", "model") == {"summary": "second"}
+
+    def test_expired_entry_is_miss(self, monkeypatch):
+        put("prompt", "model", {"summary": "old"})
+        # Jump past the TTL
+        import time
+        real_time = time.time()
+        monkeypatch.setattr("time.time", lambda: real_time + _cache.TTL_SECONDS + 1)
+        assert get("prompt", "model") is None
+
+    def test_expired_rows_purged_on_connect(self, monkeypatch):
+        import time
+        put("prompt", "model", {"summary": "old"})
+        real_time = time.time()
+        monkeypatch.setattr("time.time", lambda: real_time + _cache.TTL_SECONDS + 1)
+        from contextlib import closing
+        with closing(_cache._connect()) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        assert count == 0
+
+    def test_corrupt_entry_is_miss(self, tmp_path, monkeypatch):
+        put("prompt", "model", {"summary": "ok"})
+        with _cache._connect() as conn:
+            conn.execute("UPDATE llm_cache SET response = 'not json'")
+        assert get("prompt", "model") is None
+
+    def test_unwritable_db_ignored(self, tmp_path, monkeypatch):
+        # Point the cache at a path that can't be a database file
+        monkeypatch.setattr("ai_lint._cache.CACHE_FILE", tmp_path)
+        put("prompt", "model", {"summary": "ok"})  # should not raise
+        assert get("prompt", "model") is None
+
+
+class TestCallClaudeUsesCache:
+    def test_second_call_hits_cache(self, monkeypatch, make_fake_result):
+        from ai_lint.checker import _call_claude
+
+        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
+        calls = []
+
+        def fake_run(*args, **kwargs):
+            calls.append(args)
+            return make_fake_result(stdout=SIMPLE_JSON)
+
+        monkeypatch.setattr("subprocess.run", fake_run)
+        assert _call_claude("same prompt") == SIMPLE_PAYLOAD
+        assert _call_claude("same prompt") == SIMPLE_PAYLOAD
+        assert len(calls) == 1
+
+    def test_failures_not_cached(self, monkeypatch, make_fake_result):
+        from ai_lint.checker import _call_claude
+
+        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
+        fake = make_fake_result(returncode=1, stderr="boom")
+        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
+        with pytest.raises(RuntimeError):
+            _call_claude("prompt")
+        ok = make_fake_result(stdout=SIMPLE_JSON)
+        monkeypatch.setattr("subprocess.run", lambda *a, **kw: ok)
+        assert _call_claude("prompt") == SIMPLE_PAYLOAD
@@ -1,6 +1,7 @@
 """Tests for ai_lint.checker."""
 
 import json
+import types
 
 import pytest
 
@@ -14,78 +15,80 @@ from ai_lint.checker import (
     format_report_markdown,
     format_verdicts,
     run_check,
+    run_check_batch,
+    run_check_many,
 )
 
 
-class TestCheckClaudeInstalled:
-    def test_found(self, monkeypatch):
-        monkeypatch.setattr("shutil.which", lambda x: "/usr/local/bin/claude")
-        assert check_claude_installed() is True
+def _wrap_llm_output(body: str, *, fence: bool = False, prose: str | None = None) -> str:
+    """Encode a payload the way claude -p's JSON wrapper emits it."""
+    if fence:
+        body = "```json\n" + body + "\n```"
+    if prose is not None:
+        body = prose + "\n\n" + body
+    return json.dumps({"result": body})
+
 
-    def test_not_found(self, monkeypatch):
-        monkeypatch.setattr("shutil.which", lambda x: None)
-        assert check_claude_installed() is False
+# Shared payload for the response-parsing tests, serialized once at
+# import instead of json.dumps in every test body.
+SAMPLE_DATA = {"key": "value"}
+SAMPLE_JSON = json.dumps(SAMPLE_DATA)
+SAMPLE_FENCED = "```json\n" + SAMPLE_JSON + "\n```"
+SAMPLE_WRAPPED = _wrap_llm_output(SAMPLE_JSON)
 
 
+class TestCheckClaudeInstalled:
+    @pytest.mark.parametrize(
+        "which_return,expected",
+        [("/usr/local/bin/claude", True), (None, False)],
+        ids=["found", "not_found"],
+    )
+    def test_reports_which_result(self, monkeypatch, which_return, expected):
+        monkeypatch.setattr("shutil.which", lambda x: which_return)
+        assert check_claude_installed() is expected
+
+
+@pytest.mark.usefixtures("claude_installed")
 class TestCallClaude:
     def test_missing_claude_raises(self, monkeypatch):
+        # Overrides the class-level stub for the one negative case
         monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: False)
         with pytest.raises(ClaudeNotFoundError):
             _call_claude("prompt")
 
     def test_subprocess_failure_raises(self, monkeypatch, make_fake_result):
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
         fake = make_fake_result(returncode=1, stderr="something went wrong")
         monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
         with pytest.raises(RuntimeError, match="claude -p failed"):
             _call_claude("prompt")
 
-    def test_json_wrapper_extraction(self, monkeypatch, make_fake_result):
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        inner = {"key": "value"}
-        wrapper = {"result": json.dumps(inner)}
-        fake = make_fake_result(stdout=json.dumps(wrapper))
-        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == inner
-
-    def test_direct_json(self, monkeypatch, make_fake_result):
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        data = {"key": "value"}
-        fake = make_fake_result(stdout=json.dumps(data))
-        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == data
-
-    def test_fence_stripping(self, monkeypatch, make_fake_result):
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        data = {"key": "value"}
-        fenced = "```json\n" + json.dumps(data) + "\n```"
-        fake = make_fake_result(stdout=fenced)
-        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == data
-
-    def test_fence_stripping_after_wrapper_extraction(self, monkeypatch, make_fake_result):
-        """Fence stripping works when wrapper result has leading whitespace."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        inner = {"key": "value"}
-        fenced = "\n\n```json\n" + json.dumps(inner) + "\n```"
-        wrapper = {"result": fenced}
-        fake = make_fake_result(stdout=json.dumps(wrapper))
+    @pytest.mark.parametrize(
+        "stdout",
+        [
+            SAMPLE_JSON,
+            SAMPLE_FENCED,
+            "```json\n" + SAMPLE_JSON + "```",
+            SAMPLE_WRAPPED,
+            _wrap_llm_output(SAMPLE_JSON, fence=True, prose=""),
+            _wrap_llm_output(SAMPLE_JSON, fence=True, prose="Let me analyze this."),
+        ],
+        ids=[
+            "direct",
+            "fenced",
+            "fence_no_closing_newline",
+            "wrapper",
+            "wrapper_fenced_whitespace",
+            "wrapper_fenced_prose",
+        ],
+    )
+    def test_response_shapes_decode_to_payload(self, monkeypatch, make_fake_result, stdout):
+        """Every supported stdout shape decodes to the same inner JSON."""
+        fake = make_fake_result(stdout=stdout)
         monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == inner
-
-    def test_fence_stripping_with_prose_before(self, monkeypatch, make_fake_result):
-        """Fence extraction works when LLM adds commentary before the JSON block."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        inner = {"key": "value"}
-        raw_text = "Let me analyze this.\n\n```json\n" + json.dumps(inner) + "\n```"
-        wrapper = {"result": raw_text}
-        fake = make_fake_result(stdout=json.dumps(wrapper))
-        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == inner
+        assert _call_claude("prompt") == SAMPLE_DATA
 
     def test_no_session_persistence_flag(self, monkeypatch, make_fake_result):
         """claude -p is called with --no-session-persistence to avoid polluting session list."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
         captured = {}
         def fake_run(*args, **kwargs):
             captured["args"] = args[0]
@@ -96,7 +99,6 @@ class TestCallClaude:
 
     def test_disable_hooks_flag(self, monkeypatch, make_fake_result):
         """claude -p is called with --settings to disable hooks and prevent recursive calls."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
         captured = {}
         def fake_run(*args, **kwargs):
             captured["args"] = args[0]
@@ -107,117 +109,217 @@ class TestCallClaude:
         settings_idx = captured["args"].index("--settings")
         assert '{"disableAllHooks": true}' in captured["args"][settings_idx + 1]
 
-    def test_fence_no_newline_before_close(self, monkeypatch, make_fake_result):
-        """Fence extraction works when closing ``` has no leading newline."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        data = {"key": "value"}
-        fenced = "```json\n" + json.dumps(data) + "```"
-        fake = make_fake_result(stdout=fenced)
-        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
-        assert _call_claude("prompt") == data
-
     def test_brace_extraction_fallback(self, monkeypatch, make_fake_result):
         """Falls back to extracting outermost { ... } when fences don't match."""
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
-        data = {"key": "value"}
-        messy = "Here is the result: " + json.dumps(data) + " hope that helps"
+        messy = "Here is the result: " + SAMPLE_JSON + " hope that helps"
+        fake = make_fake_result(stdout=messy)
+        monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
+        assert _call_claude("prompt") == SAMPLE_DATA
+
+    def test_brace_extraction_with_braces_in_strings(self, monkeypatch, make_fake_result):
+        """Brace fallback isn't confused by braces inside JSON string values."""
+        data = {"key": "has { and } inside"}
+        messy = "Result: " + json.dumps(data) + " } stray brace"
         fake = make_fake_result(stdout=messy)
         monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
         assert _call_claude("prompt") == data
 
     def test_invalid_json_raises(self, monkeypatch, make_fake_result):
-        monkeypatch.setattr("ai_lint.checker.check_claude_installed", lambda: True)
         fake = make_fake_result(stdout="not json at all")
         monkeypatch.setattr("subprocess.run", lambda *a, **kw: fake)
         with pytest.raises(RuntimeError, match="Failed to parse"):
             _call_claude("prompt")
 
 
+@pytest.fixture()
+def patch_call_claude(monkeypatch):
+    """Stub checker._call_claude with a configurable double.
+
+    Set .result to choose the return value, .error to raise instead;
+    every received prompt is recorded in .prompts.
+    """
+    state = types.SimpleNamespace(result=None, error=None, prompts=[])
+
+    def fake_call(prompt):
+        state.prompts.append(prompt)
+        if state.error is not None:
+            raise state.error
+        return state.result
+
+    monkeypatch.setattr("ai_lint.checker._call_claude", fake_call)
+    return state
+
+
 class TestRunCheck:
-    def test_returns_call_claude_result(self, monkeypatch):
+    def test_returns_call_claude_result(self, patch_call_claude):
         expected = {"verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}], "summary": "good"}
-        monkeypatch.setattr("ai_lint.checker._call_claude", lambda prompt: expected)
+        patch_call_claude.result = expected
         assert run_check("transcript", "policy") == expected
 
-    def test_prompt_includes_transcript_and_policy(self, monkeypatch):
-        captured = {}
-        def fake_call(prompt):
-            captured["prompt"] = prompt
-            return {"verdicts": [], "summary": ""}
-        monkeypatch.setattr("ai_lint.checker._call_claude", fake_call)
+    def test_prompt_includes_transcript_and_policy(self, patch_call_claude):
+        patch_call_claude.result = {"verdicts": [], "summary": ""}
         run_check("my transcript", "my policy")
-        assert "my transcript" in captured["prompt"]
-        assert "my policy" in captured["prompt"]
+        assert "my transcript" in patch_call_claude.prompts[0]
+        assert "my policy" in patch_call_claude.prompts[0]
 
-    def test_propagates_claude_not_found(self, monkeypatch):
-        def raise_not_found(prompt):
-            raise ClaudeNotFoundError("not found")
-        monkeypatch.setattr("ai_lint.checker._call_claude", raise_not_found)
+    def test_propagates_claude_not_found(self, patch_call_claude):
+        patch_call_claude.error = ClaudeNotFoundError("not found")
         with pytest.raises(ClaudeNotFoundError):
             run_check("transcript", "policy")
 
 
+class TestRunCheckMany:
+    def test_results_in_input_order(self, monkeypatch):
+        async def fake_call(prompt):
+            return {"prompt": prompt}
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        results = run_check_many([("t1", "policy"), ("t2", "policy")])
+        assert "t1" in results[0]["prompt"]
+        assert "t2" in results[1]["prompt"]
+
+    def test_failures_returned_as_exceptions(self, monkeypatch):
+        async def flaky_call(prompt):
+            if "bad" in prompt:
+                raise RuntimeError("boom")
+            return {"verdicts": [], "summary": ""}
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", flaky_call)
+        results = run_check_many([("good transcript", "p"), ("bad transcript", "p")])
+        assert results[0] == {"verdicts": [], "summary": ""}
+        assert isinstance(results[1], RuntimeError)
+
+    def test_empty_pairs(self, monkeypatch):
+        results = run_check_many([])
+        assert results == []
+
+
+class TestRunCheckBatch:
+    def _batched_response(self, count):
+        return {
+            "sessions": [
+                {"id": i, "verdicts": [{"rule": f"R{i}", "verdict": "PASS", "reasoning": "ok"}], "summary": f"s{i}"}
+                for i in range(count)
+            ]
+        }
+
+    def test_demuxes_batched_response(self, monkeypatch):
+        async def fake_call(prompt):
+            assert "=== SESSION 0 ===" in prompt
+            assert "=== SESSION 1 ===" in prompt
+            return self._batched_response(2)
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        results = run_check_batch([("t1", "policy"), ("t2", "policy")])
+        assert results[0]["verdicts"][0]["rule"] == "R0"
+        assert results[1]["summary"] == "s1"
+
+    def test_splits_oversized_batches(self, monkeypatch):
+        calls = []
+
+        async def fake_call(prompt):
+            calls.append(prompt)
+            return self._batched_response(1)
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        monkeypatch.setattr("ai_lint.checker.BATCH_CHAR_BUDGET", 10)
+        results = run_check_batch([("x" * 20, "p"), ("y" * 20, "p")])
+        assert len(calls) == 2
+        assert all(r["summary"] == "s0" for r in results)
+
+    def test_mixed_policies_not_batched_together(self, monkeypatch):
+        prompts = []
+
+        async def fake_call(prompt):
+            prompts.append(prompt)
+            return self._batched_response(1)
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        run_check_batch([("t1", "policy-a"), ("t2", "policy-b")])
+        assert len(prompts) == 2
+        assert "policy-a" in prompts[0] and "t1" in prompts[0]
+        assert "policy-b" in prompts[1] and "t2" in prompts[1]
+
+    def test_schema_mismatch_falls_back_to_single_calls(self, monkeypatch):
+        async def fake_call(prompt):
+            if "=== SESSION" in prompt:
+                return {"unexpected": "shape"}
+            return {"verdicts": [], "summary": "single"}
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        results = run_check_batch([("t1", "p"), ("t2", "p")])
+        assert results == [
+            {"verdicts": [], "summary": "single"},
+            {"verdicts": [], "summary": "single"},
+        ]
+
+    def test_batch_failure_reported_per_session(self, monkeypatch):
+        async def fake_call(prompt):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr("ai_lint.checker._call_claude_async", fake_call)
+        results = run_check_batch([("t1", "p"), ("t2", "p")])
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_empty_pairs(self):
+        assert run_check_batch([]) == []
+
+
 class TestExtractInsights:
-    def test_returns_validated_result(self, monkeypatch, sample_insights):
-        monkeypatch.setattr("ai_lint.checker._call_claude", lambda prompt: sample_insights)
+    def test_returns_validated_result(self, patch_call_claude, sample_insights):
+        patch_call_claude.result = sample_insights
         result = extract_insights("transcript", "policy")
         assert result["what_went_well"][0]["pattern"] == "Clear problem description"
 
-    def test_prompt_includes_transcript_and_policy(self, monkeypatch):
-        captured = {}
-        def fake_call(prompt):
-            captured["prompt"] = prompt
-            return {"what_went_well": [], "what_to_improve": [], "notable": []}
-        monkeypatch.setattr("ai_lint.checker._call_claude", fake_call)
+    def test_prompt_includes_transcript_and_policy(self, patch_call_claude):
+        patch_call_claude.result = {"what_went_well": [], "what_to_improve": [], "notable": []}
         extract_insights("my transcript", "my policy")
-        assert "my transcript" in captured["prompt"]
-        assert "my policy" in captured["prompt"]
+        assert "my transcript" in patch_call_claude.prompts[0]
+        assert "my policy" in patch_call_claude.prompts[0]
 
-    def test_validates_malformed_response(self, monkeypatch):
-        monkeypatch.setattr("ai_lint.checker._call_claude", lambda prompt: {"bad_key": 123})
+    def test_validates_malformed_response(self, patch_call_claude):
+        patch_call_claude.result = {"bad_key": 123}
         result = extract_insights("transcript", "policy")
         assert result == {"what_went_well": [], "what_to_improve": [], "notable": []}
 
-    def test_propagates_claude_not_found(self, monkeypatch):
-        def raise_not_found(prompt):
-            raise ClaudeNotFoundError("not found")
-        monkeypatch.setattr("ai_lint.checker._call_claude", raise_not_found)
+    def test_propagates_claude_not_found(self, patch_call_claude):
+        patch_call_claude.error = ClaudeNotFoundError("not found")
         with pytest.raises(ClaudeNotFoundError):
             extract_insights("transcript", "policy")
 
 
+@pytest.fixture(scope="module")
+def verdicts_output(sample_verdicts):
+    """format_verdicts is deterministic — render the sample once per module."""
+    return format_verdicts(sample_verdicts)
+
+
 class TestFormatVerdicts:
-    def test_icons(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        assert "[+] PASS" in output
-        assert "[x] FAIL" in output
-        assert "[-] SKIP" in output
-
-    def test_compact_tally(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        assert "3/5 passed" in output
-
-    def test_no_category_headers(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        lines = output.split("\n")
+    def test_icons(self, verdicts_output):
+        assert "[+] PASS" in verdicts_output
+        assert "[x] FAIL" in verdicts_output
+        assert "[-] SKIP" in verdicts_output
+
+    def test_compact_tally(self, verdicts_output):
+        assert "3/5 passed" in verdicts_output
+
+    def test_no_category_headers(self, verdicts_output):
+        lines = verdicts_output.split("\n")
         # Category names should not appear as standalone header lines
         header_lines = [l.strip() for l in lines if l.strip() in ("Security", "Developer Engagement", "Process Discipline")]
         assert header_lines == []
 
-    def test_no_summary(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        assert "Summary:" not in output
-        assert "Mostly compliant" not in output
+    def test_no_summary(self, verdicts_output):
+        assert "Summary:" not in verdicts_output
+        assert "Mostly compliant" not in verdicts_output
 
-    def test_pass_no_reasoning(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        assert "No secrets found" not in output
-        assert "Developer showed understanding" not in output
+    def test_pass_no_reasoning(self, verdicts_output):
+        assert "No secrets found" not in verdicts_output
+        assert "Developer showed understanding" not in verdicts_output
 
-    def test_fail_includes_reasoning(self, sample_verdicts):
-        output = format_verdicts(sample_verdicts)
-        assert "Developer did not review" in output
-        assert "[x] FAIL: Review before acceptance — Developer did not review." in output
+    def test_fail_includes_reasoning(self, verdicts_output):
+        assert "Developer did not review" in verdicts_output
+        assert "[x] FAIL: Review before acceptance — Developer did not review." in verdicts_output
 
     def test_empty_verdicts(self):
         output = format_verdicts({"verdicts": [], "summary": ""})
@@ -233,21 +335,24 @@ class TestFormatVerdicts:
         assert "1/1 passed" in output
 
 
+@pytest.fixture(scope="module")
+def single_session_report(sample_verdicts):
+    """One-session markdown report, rendered once per module."""
+    return format_report_markdown([{"session_label": "Session A", "result": sample_verdicts}])
+
+
 class TestFormatReportMarkdown:
-    def test_header(self, sample_verdicts):
-        report = format_report_markdown([{"session_label": "Session A", "result": sample_verdicts}])
-        assert "# ai-lint Compliance Report" in report
+    def test_header(self, single_session_report):
+        assert "# ai-lint Compliance Report" in single_session_report
 
-    def test_emojis(self, sample_verdicts):
-        report = format_report_markdown([{"session_label": "Session A", "result": sample_verdicts}])
-        assert "\u2705" in report  # checkmark
-        assert "\u274c" in report  # X
+    def test_emojis(self, single_session_report):
+        assert "\u2705" in single_session_report  # checkmark
+        assert "\u274c" in single_session_report  # X
 
-    def test_category_sections_in_report(self, sample_verdicts):
-        report = format_report_markdown([{"session_label": "Session A", "result": sample_verdicts}])
-        assert "### Security" in report
-        assert "### Developer Engagement" in report
-        assert "### Process Discipline" in report
+    def test_category_sections_in_report(self, single_session_report):
+        assert "### Security" in single_session_report
+        assert "### Developer Engagement" in single_session_report
+        assert "### Process Discipline" in single_session_report
 
     def test_multi_session_totals(self, sample_verdicts):
         entries = [
@@ -259,13 +364,11 @@ class TestFormatReportMarkdown:
         assert "6 passed" in report  # 3 per session
         assert "2 failed" in report
 
-    def test_per_session_score(self, sample_verdicts):
-        report = format_report_markdown([{"session_label": "S1", "result": sample_verdicts}])
-        assert "3 passed, 1 failed, 1 skipped" in report
+    def test_per_session_score(self, single_session_report):
+        assert "3 passed, 1 failed, 1 skipped" in single_session_report
 
-    def test_session_summary_quoted(self, sample_verdicts):
-        report = format_report_markdown([{"session_label": "S1", "result": sample_verdicts}])
-        assert "> Mostly compliant" in report
+    def test_session_summary_quoted(self, single_session_report):
+        assert "> Mostly compliant" in single_session_report
 
     def test_empty_sessions(self):
         report = format_report_markdown([])
@@ -277,8 +380,13 @@ class TestValidateInsights:
         result = _validate_insights(sample_insights)
         assert result == sample_insights
 
-    def test_missing_keys_filled(self):
-        result = _validate_insights({})
+    @pytest.mark.parametrize(
+        "raw",
+        [{}, "not a dict", None],
+        ids=["missing_keys", "string", "none"],
+    )
+    def test_invalid_shapes_return_defaults(self, raw):
+        result = _validate_insights(raw)
         assert result == {"what_went_well": [], "what_to_improve": [], "notable": []}
 
     def test_malformed_items_filtered(self):
@@ -299,27 +407,27 @@ class TestValidateInsights:
         assert result["what_went_well"][0]["pattern"] == "Good"
         assert len(result["notable"]) == 1
 
-    def test_non_dict_returns_defaults(self):
-        result = _validate_insights("not a dict")
-        assert result == {"what_went_well": [], "what_to_improve": [], "notable": []}
+
+@pytest.fixture(scope="module")
+def insights_output(sample_insights):
+    """Formatted sample insights, rendered once per module."""
+    return format_insights(sample_insights)
 
 
 class TestFormatInsights:
-    def test_full_output(self, sample_insights):
-        output = format_insights(sample_insights)
-        assert "What went well:" in output
-        assert "Clear problem description" in output
-        assert "What to improve:" in output
-        assert "No testing discussed" in output
+    def test_full_output(self, insights_output):
+        assert "What went well:" in insights_output
+        assert "Clear problem description" in insights_output
+        assert "What to improve:" in insights_output
+        assert "No testing discussed" in insights_output
 
     def test_empty_insights(self):
         output = format_insights({"what_went_well": [], "what_to_improve": [], "notable": []})
         assert "What went well:" not in output
         assert "What to improve:" not in output
 
-    def test_header_present(self, sample_insights):
-        output = format_insights(sample_insights)
-        assert "--- Session Insights ---" in output
+    def test_header_present(self, insights_output):
+        assert "--- Session Insights ---" in insights_output
 
     def test_notable_section(self):
         insights = {
@@ -1,17 +1,24 @@
 """Tests for ai_lint.cli via Click's CliRunner."""
 
-import json
-from pathlib import Path
-from unittest.mock import patch
-
 import pytest
 from click.testing import CliRunner
 
 from ai_lint.cli import cli
 
 
-@pytest.fixture()
+FAKE_RESULT = {
+    "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
+    "summary": "good",
+}
+
+
+def _must_not_call(*args, **kwargs):
+    raise AssertionError("extract_insights should not run")
+
+
+@pytest.fixture(scope="session")
 def runner():
+    """One CliRunner for the whole session — invoke() keeps no state."""
     return CliRunner()
 
 
@@ -31,47 +38,44 @@ def full_setup(config_dir, installed_policy, claude_projects_dir, sample_jsonl_s
 
 
 class TestInit:
-    @pytest.mark.parametrize("choice", ["1", "2", "self", "team"])
-    def test_all_persona_choices(self, runner, config_dir, claude_settings_dir, monkeypatch, choice):
+    @pytest.fixture(autouse=True)
+    def _init_env(self, monkeypatch, config_dir, claude_settings_dir):
+        """Default init environment: claude present, hook not installed.
+
+        claude_settings_dir already redirects CLAUDE_SETTINGS; tests
+        that need a different stub override it inline.
+        """
         monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: True)
         monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: False)
-        monkeypatch.setattr("ai_lint.setup_hook.CLAUDE_SETTINGS", claude_settings_dir)
+
+    @pytest.mark.parametrize("choice", ["1", "2", "self", "team"])
+    def test_all_persona_choices(self, runner, choice):
         result = runner.invoke(cli, ["init"], input=f"{choice}\nn\n")
         assert result.exit_code == 0
         assert "Done!" in result.output
 
-    def test_claude_not_found_warning(self, runner, config_dir, claude_settings_dir, monkeypatch):
+    def test_claude_not_found_warning(self, runner, monkeypatch):
         monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: False)
-        monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: False)
-        monkeypatch.setattr("ai_lint.setup_hook.CLAUDE_SETTINGS", claude_settings_dir)
         result = runner.invoke(cli, ["init"], input="1\nn\n")
         assert "[!!] claude CLI not found" in result.output
 
-    def test_overwrite_existing_policy(self, runner, installed_policy, config_dir, claude_settings_dir, monkeypatch):
-        monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: True)
+    def test_overwrite_existing_policy(self, runner, installed_policy, monkeypatch):
         monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: True)
         result = runner.invoke(cli, ["init"], input="2\ny\n")
         assert result.exit_code == 0
         assert "Installed 'team' policy" in result.output
 
-    def test_keep_existing_policy(self, runner, installed_policy, config_dir, claude_settings_dir, monkeypatch):
-        monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: True)
+    def test_keep_existing_policy(self, runner, installed_policy, monkeypatch):
         monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: True)
         result = runner.invoke(cli, ["init"], input="1\nn\n")
         assert "Keeping existing policy" in result.output
 
-    def test_install_hook_yes(self, runner, config_dir, claude_settings_dir, monkeypatch):
-        monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: True)
-        monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: False)
-        monkeypatch.setattr("ai_lint.setup_hook.CLAUDE_SETTINGS", claude_settings_dir)
+    def test_install_hook_yes(self, runner):
         result = runner.invoke(cli, ["init"], input="1\ny\n")
         assert result.exit_code == 0
         assert "Installed SessionEnd hook" in result.output
 
-    def test_skip_hook(self, runner, config_dir, claude_settings_dir, monkeypatch):
-        monkeypatch.setattr("ai_lint.cli.check_claude_installed", lambda: True)
-        monkeypatch.setattr("ai_lint.cli.is_hook_installed", lambda: False)
-        monkeypatch.setattr("ai_lint.setup_hook.CLAUDE_SETTINGS", claude_settings_dir)
+    def test_skip_hook(self, runner):
         result = runner.invoke(cli, ["init"], input="1\nn\n")
         assert "Skipped hook installation" in result.output
 
@@ -91,33 +95,21 @@ class TestCheck:
         assert "No sessions found" in result.output
 
     def test_last_flag(self, runner, full_setup, monkeypatch, sample_insights):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
         monkeypatch.setattr("ai_lint.cli.extract_insights", lambda t, p: sample_insights)
         result = runner.invoke(cli, ["check", "--last"])
         assert result.exit_code == 0
         assert "PASS" in result.output
 
     def test_quiet_flag(self, runner, full_setup, monkeypatch):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
         result = runner.invoke(cli, ["check", "--last", "--quiet"])
         assert result.exit_code == 0
         assert "Parsing session" not in result.output
         assert "PASS" in result.output
 
     def test_session_picker(self, runner, full_setup, monkeypatch, sample_insights):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
         monkeypatch.setattr("ai_lint.cli.extract_insights", lambda t, p: sample_insights)
         result = runner.invoke(cli, ["check"], input="1\n")
         assert result.exit_code == 0
@@ -141,11 +133,7 @@ class TestCheck:
         assert "no messages" in result.output
 
     def test_insights_displayed(self, runner, full_setup, monkeypatch, sample_insights):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
         monkeypatch.setattr("ai_lint.cli.extract_insights", lambda t, p: sample_insights)
         result = runner.invoke(cli, ["check", "--last"])
         assert result.exit_code == 0
@@ -153,36 +141,17 @@ class TestCheck:
         assert "Session Insights" in result.output
         assert "Clear problem description" in result.output
 
-    def test_no_insights_flag(self, runner, full_setup, monkeypatch):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
-        # extract_insights should not be called; if it is, it would fail
-        monkeypatch.setattr("ai_lint.cli.extract_insights", lambda t, p: (_ for _ in ()).throw(AssertionError("should not be called")))
-        result = runner.invoke(cli, ["check", "--last", "--no-insights"])
+    @pytest.mark.parametrize("flag", ["--no-insights", "--quiet"])
+    def test_insights_skipped(self, runner, full_setup, monkeypatch, flag):
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
+        monkeypatch.setattr("ai_lint.cli.extract_insights", _must_not_call)
+        result = runner.invoke(cli, ["check", "--last", flag])
         assert result.exit_code == 0
         assert "PASS" in result.output
         assert "Session Insights" not in result.output
 
-    def test_quiet_skips_insights(self, runner, full_setup, monkeypatch):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
-        monkeypatch.setattr("ai_lint.cli.extract_insights", lambda t, p: (_ for _ in ()).throw(AssertionError("should not be called")))
-        result = runner.invoke(cli, ["check", "--last", "--quiet"])
-        assert result.exit_code == 0
-        assert "Session Insights" not in result.output
-
     def test_insight_failure_still_shows_verdicts(self, runner, full_setup, monkeypatch):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: FAKE_RESULT)
 
         def fail_insights(t, p):
             raise RuntimeError("insight LLM failed")
@@ -209,21 +178,13 @@ class TestReport:
         assert "No sessions found" in result.output
 
     def test_count_flag(self, runner, full_setup, monkeypatch):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check_batch", lambda pairs, **kw: [FAKE_RESULT] * len(pairs))
         result = runner.invoke(cli, ["report", "-n", "1"])
         assert result.exit_code == 0
         assert "Checked 1 sessions" in result.output
 
     def test_output_flag(self, runner, full_setup, monkeypatch, tmp_path):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check_batch", lambda pairs, **kw: [FAKE_RESULT] * len(pairs))
         outfile = tmp_path / "report.md"
         result = runner.invoke(cli, ["report", "-n", "1", "-o", str(outfile)])
         assert result.exit_code == 0
@@ -231,23 +192,16 @@ class TestReport:
         assert "ai-lint Compliance Report" in outfile.read_text()
 
     def test_default_filename(self, runner, full_setup, monkeypatch, tmp_path, monkeypatch_cwd=None):
-        fake_result = {
-            "verdicts": [{"rule": "R1", "verdict": "PASS", "reasoning": "ok"}],
-            "summary": "good",
-        }
-        monkeypatch.setattr("ai_lint.cli.run_check", lambda t, p: fake_result)
+        monkeypatch.setattr("ai_lint.cli.run_check_batch", lambda pairs, **kw: [FAKE_RESULT] * len(pairs))
         result = runner.invoke(cli, ["report", "-n", "1"])
         assert result.exit_code == 0
         assert "Report saved to ai-lint-report-" in result.output
 
     def test_runtime_error_continues(self, runner, full_setup, monkeypatch):
-        call_count = [0]
-
-        def flaky_check(t, p):
-            call_count[0] += 1
-            raise RuntimeError("oops")
-
-        monkeypatch.setattr("ai_lint.cli.run_check", flaky_check)
+        monkeypatch.setattr(
+            "ai_lint.cli.run_check_batch",
+            lambda pairs, **kw: [RuntimeError("oops")] * len(pairs),
+        )
         result = runner.invoke(cli, ["report", "-n", "1"])
         assert result.exit_code == 0
         assert "No sessions had messages" in result.output
@@ -272,13 +226,11 @@ class TestPolicy:
 
 
 class TestHook:
-    def test_install(self, runner, claude_settings_dir):
+    def test_install_then_uninstall(self, runner, claude_settings_dir):
         result = runner.invoke(cli, ["hook", "install"])
         assert result.exit_code == 0
         assert "Installed" in result.output
 
-    def test_uninstall(self, runner, claude_settings_dir):
-        runner.invoke(cli, ["hook", "install"])
         result = runner.invoke(cli, ["hook", "uninstall"])
         assert result.exit_code == 0
         assert "Removed" in result.output
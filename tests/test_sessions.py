@@ -1,7 +1,7 @@
 """Tests for ai_lint.sessions."""
 
 import json
-import time
+import os
 from pathlib import Path
 
 import pytest
@@ -12,11 +12,39 @@ from ai_lint.sessions import (
     _extract_text,
     _is_ai_lint_session,
     discover_sessions,
+    filter_user_sessions,
     format_transcript,
     parse_session,
 )
 
 
+def _user_line(content) -> bytes:
+    """Serialize a single-user-message JSONL line."""
+    entry = {
+        "type": "user",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "message": {"role": "user", "content": content},
+    }
+    return json.dumps(entry).encode() + b"\n"
+
+
+# Serialized once at import — tests write these verbatim.
+CHECKER_LINE = _user_line("You are a compliance auditor for AI coding sessions. Evaluate...")
+INSIGHT_LINE = _user_line("You are a development coach reviewing an AI coding session transcript. Focus on...")
+NORMAL_LINE = _user_line("Help me fix a bug")
+EMPTY_LINE = b"{}\n"
+LONG_TOOL_RESULT = [{"type": "tool_result", "content": "x" * 600}]
+
+
+def _make_project(base, name, files):
+    """Create a project dir and write pre-serialized session files into it."""
+    proj = base / name
+    proj.mkdir(parents=True, exist_ok=True)
+    for filename, line in files.items():
+        (proj / filename).write_bytes(line)
+    return proj
+
+
 # -- _extract_text --
 
 
@@ -35,44 +63,23 @@ class TestExtractText:
         ]
         assert _extract_text(blocks) == "Line 1\nLine 2"
 
-    def test_tool_use_bash(self):
-        blocks = [{"type": "tool_use", "name": "Bash", "input": {"command": "ls -la"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Bash]" in result
-        assert "ls -la" in result
-
-    def test_tool_use_read(self):
-        blocks = [{"type": "tool_use", "name": "Read", "input": {"file_path": "/foo/bar.py"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Read]" in result
-        assert "/foo/bar.py" in result
-
-    def test_tool_use_write(self):
-        blocks = [{"type": "tool_use", "name": "Write", "input": {"file_path": "/a/b.py"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Write]" in result
-
-    def test_tool_use_edit(self):
-        blocks = [{"type": "tool_use", "name": "Edit", "input": {"file_path": "/x.py"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Edit]" in result
-
-    def test_tool_use_grep(self):
-        blocks = [{"type": "tool_use", "name": "Grep", "input": {"pattern": "foo.*bar"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Grep]" in result
-        assert "foo.*bar" in result
-
-    def test_tool_use_glob(self):
-        blocks = [{"type": "tool_use", "name": "Glob", "input": {"pattern": "**/*.py"}}]
-        result = _extract_text(blocks)
-        assert "[Tool: Glob]" in result
-        assert "**/*.py" in result
-
-    def test_tool_use_unknown(self):
-        blocks = [{"type": "tool_use", "name": "CustomTool", "input": {}}]
+    @pytest.mark.parametrize(
+        "tool, tool_input, expected",
+        [
+            ("Bash", {"command": "ls -la"}, "ls -la"),
+            ("Read", {"file_path": "/foo/bar.py"}, "/foo/bar.py"),
+            ("Write", {"file_path": "/a/b.py"}, "/a/b.py"),
+            ("Edit", {"file_path": "/x.py"}, "/x.py"),
+            ("Grep", {"pattern": "foo.*bar"}, "foo.*bar"),
+            ("Glob", {"pattern": "**/*.py"}, "**/*.py"),
+            ("CustomTool", {}, ""),
+        ],
+    )
+    def test_tool_use(self, tool, tool_input, expected):
+        blocks = [{"type": "tool_use", "name": tool, "input": tool_input}]
         result = _extract_text(blocks)
-        assert "[Tool: CustomTool]" in result
+        assert f"[Tool: {tool}]" in result
+        assert expected in result
 
     def test_tool_result_string(self):
         blocks = [{"type": "tool_result", "content": "output here"}]
@@ -81,9 +88,7 @@ class TestExtractText:
         assert "output here" in result
 
     def test_tool_result_truncation(self):
-        long_content = "x" * 600
-        blocks = [{"type": "tool_result", "content": long_content}]
-        result = _extract_text(blocks)
+        result = _extract_text(LONG_TOOL_RESULT)
         assert "(truncated)" in result
         assert len(result) < 600
 
@@ -124,23 +129,23 @@ class TestDiscoverSessions:
         assert sessions[0].session_id == "abc12345-1111-2222-3333-444444444444"
 
     def test_skips_subagents(self, claude_projects_dir):
-        sub = claude_projects_dir / "project" / "subagents"
-        sub.mkdir(parents=True)
-        (sub / "session.jsonl").write_text("{}\n")
+        _make_project(claude_projects_dir, "project/subagents", {"session.jsonl": EMPTY_LINE})
         # Also add a regular session
-        proj = claude_projects_dir / "project"
-        (proj / "main.jsonl").write_text("{}\n")
+        _make_project(claude_projects_dir, "project", {"main.jsonl": EMPTY_LINE})
         sessions = discover_sessions()
         ids = [s.session_id for s in sessions]
         assert "session" not in ids
         assert "main" in ids
 
     def test_sorted_by_mtime(self, claude_projects_dir):
-        proj = claude_projects_dir / "project"
-        proj.mkdir()
-        (proj / "old.jsonl").write_text("{}\n")
-        time.sleep(0.05)
-        (proj / "new.jsonl").write_text("{}\n")
+        proj = _make_project(
+            claude_projects_dir, "project",
+            {"old.jsonl": EMPTY_LINE, "new.jsonl": EMPTY_LINE},
+        )
+        # Stamp mtimes explicitly — sleeping between writes is slow and
+        # flaky on filesystems with coarse mtime resolution.
+        os.utime(proj / "old.jsonl", (1_000_000, 1_000_000))
+        os.utime(proj / "new.jsonl", (2_000_000, 2_000_000))
         sessions = discover_sessions()
         assert sessions[0].session_id == "new"
         assert sessions[1].session_id == "old"
@@ -155,9 +160,7 @@ class TestDiscoverSessions:
 
     def test_multiple_projects(self, claude_projects_dir):
         for name in ["proj-a", "proj-b"]:
-            d = claude_projects_dir / name
-            d.mkdir()
-            (d / "s.jsonl").write_text("{}\n")
+            _make_project(claude_projects_dir, name, {"s.jsonl": EMPTY_LINE})
         sessions = discover_sessions()
         assert len(sessions) == 2
 
@@ -166,36 +169,22 @@ class TestDiscoverSessions:
 
 
 class TestIsAiLintSession:
-    def _write_session(self, directory, filename, content):
-        """Helper to write a JSONL session with a single user message."""
-        entry = {
-            "type": "user",
-            "timestamp": "2025-01-01T00:00:00Z",
-            "message": {"role": "user", "content": content},
-        }
+    def _write_session(self, directory, filename, line):
+        """Helper to write a JSONL session from a pre-serialized line."""
         path = directory / filename
-        path.write_text(json.dumps(entry) + "\n")
+        path.write_bytes(line)
         return path
 
     def test_checker_prompt_detected(self, tmp_path):
-        path = self._write_session(
-            tmp_path, "s.jsonl",
-            "You are a compliance auditor for AI coding sessions. Evaluate...",
-        )
+        path = self._write_session(tmp_path, "s.jsonl", CHECKER_LINE)
         assert _is_ai_lint_session(path) is True
 
     def test_insight_prompt_detected(self, tmp_path):
-        path = self._write_session(
-            tmp_path, "s.jsonl",
-            "You are a development coach reviewing an AI coding session transcript. Focus on...",
-        )
+        path = self._write_session(tmp_path, "s.jsonl", INSIGHT_LINE)
         assert _is_ai_lint_session(path) is True
 
     def test_normal_session_not_filtered(self, tmp_path):
-        path = self._write_session(
-            tmp_path, "s.jsonl",
-            "Help me refactor the auth module",
-        )
+        path = self._write_session(tmp_path, "s.jsonl", NORMAL_LINE)
         assert _is_ai_lint_session(path) is False
 
     def test_empty_file(self, tmp_path):
@@ -233,57 +222,95 @@ class TestIsAiLintSession:
         assert _is_ai_lint_session(path) is False
 
 
-class TestDiscoverSessionsFiltersAiLint:
+class TestClassifyCache:
+    def _write_session(self, directory, filename="s.jsonl", line=NORMAL_LINE):
+        path = directory / filename
+        path.write_bytes(line)
+        return path
+
+    def test_second_call_skips_reparse(self, tmp_path, monkeypatch):
+        from ai_lint import sessions
+
+        path = self._write_session(tmp_path)
+        calls = []
+        real = sessions._classify_session
+        monkeypatch.setattr(
+            "ai_lint.sessions._classify_session",
+            lambda p: calls.append(p) or real(p),
+        )
+        assert _is_ai_lint_session(path) is False
+        assert _is_ai_lint_session(path) is False
+        assert len(calls) == 1
+
+    def test_persists_across_reload(self, tmp_path, monkeypatch):
+        from ai_lint import sessions
+
+        path = self._write_session(tmp_path)
+        assert _is_ai_lint_session(path) is False
+        sessions._flush_classify_cache()
+        assert sessions.CLASSIFY_CACHE_FILE.exists()
+
+        # Simulate a fresh process: drop the in-memory cache.
+        monkeypatch.setattr("ai_lint.sessions._classify_cache", None)
+        monkeypatch.setattr(
+            "ai_lint.sessions._classify_session",
+            lambda p: pytest.fail("should have hit the persisted cache"),
+        )
+        assert _is_ai_lint_session(path) is False
+
+    def test_modified_file_reclassified(self, tmp_path):
+        path = self._write_session(tmp_path)
+        assert _is_ai_lint_session(path) is False
+        self._write_session(tmp_path, line=CHECKER_LINE)
+        assert _is_ai_lint_session(path) is True
+
+
+class TestFilterUserSessions:
     def test_checker_sessions_filtered(self, claude_projects_dir):
-        proj = claude_projects_dir / "project"
-        proj.mkdir()
-        # ai-lint checker session
-        checker_entry = {
-            "type": "user",
-            "timestamp": "2025-01-01T00:00:00Z",
-            "message": {
-                "role": "user",
-                "content": "You are a compliance auditor for AI coding sessions. Evaluate...",
-            },
-        }
-        (proj / "checker.jsonl").write_text(json.dumps(checker_entry) + "\n")
-        # Normal session
-        normal_entry = {
-            "type": "user",
-            "timestamp": "2025-01-01T00:00:00Z",
-            "message": {"role": "user", "content": "Help me fix a bug"},
-        }
-        (proj / "normal.jsonl").write_text(json.dumps(normal_entry) + "\n")
-        sessions = discover_sessions()
+        _make_project(
+            claude_projects_dir, "project",
+            {"checker.jsonl": CHECKER_LINE, "normal.jsonl": NORMAL_LINE},
+        )
+        sessions = filter_user_sessions(discover_sessions())
         ids = [s.session_id for s in sessions]
         assert "checker" not in ids
         assert "normal" in ids
 
-    def test_insight_sessions_filtered(self, claude_projects_dir):
-        proj = claude_projects_dir / "project"
-        proj.mkdir()
-        insight_entry = {
-            "type": "user",
-            "timestamp": "2025-01-01T00:00:00Z",
-            "message": {
-                "role": "user",
-                "content": "You are a development coach reviewing an AI coding session transcript. Focus on...",
-            },
-        }
-        (proj / "insight.jsonl").write_text(json.dumps(insight_entry) + "\n")
+    def test_limit_stops_classification(self, claude_projects_dir, monkeypatch):
+        _make_project(
+            claude_projects_dir, "project",
+            {f"s{i}.jsonl": EMPTY_LINE for i in range(5)},
+        )
+        calls = []
+        monkeypatch.setattr(
+            "ai_lint.sessions._is_ai_lint_session",
+            lambda path: calls.append(path) or False,
+        )
+        out = filter_user_sessions(discover_sessions(), limit=2)
+        assert len(out) == 2
+        assert len(calls) == 2
+
+    def test_classification_cached_on_session(self, claude_projects_dir, monkeypatch):
+        _make_project(claude_projects_dir, "project", {"s.jsonl": EMPTY_LINE})
+        calls = []
+        monkeypatch.setattr(
+            "ai_lint.sessions._is_ai_lint_session",
+            lambda path: calls.append(path) or False,
+        )
         sessions = discover_sessions()
+        filter_user_sessions(sessions)
+        filter_user_sessions(sessions)
+        assert len(calls) == 1
+        assert sessions[0].is_ailint is False
+
+    def test_insight_sessions_filtered(self, claude_projects_dir):
+        _make_project(claude_projects_dir, "project", {"insight.jsonl": INSIGHT_LINE})
+        sessions = filter_user_sessions(discover_sessions())
         assert len(sessions) == 0
 
     def test_normal_sessions_not_filtered(self, claude_projects_dir):
-        proj = claude_projects_dir / "project"
-        proj.mkdir()
-        normal_entry = {
-            "type": "user",
-            "timestamp": "2025-01-01T00:00:00Z",
-            "message": {"role": "user", "content": "Help me refactor the auth module"},
-        }
-        (proj / "normal.jsonl").write_text(json.dumps(normal_entry) + "\n")
-        sessions = discover_sessions()
+        _make_project(claude_projects_dir, "project", {"normal.jsonl": NORMAL_LINE})
+        sessions = filter_user_sessions(discover_sessions())
         assert len(sessions) == 1
         assert sessions[0].session_id == "normal"
 
@@ -292,45 +319,40 @@ class TestDiscoverSessionsFiltersAiLint:
 
 
 class TestParseSession:
+    def _session_for(self, path):
+        """Build a Session for a known file without scanning directories."""
+        return Session(session_id=path.stem, path=path, project=path.parent.name)
+
     def test_basic_parse(self, sample_jsonl_session, claude_projects_dir):
+        # The one test that keeps the discover → parse pipeline covered.
         sessions = discover_sessions()
         s = parse_session(sessions[0])
         assert len(s.messages) >= 3
         assert s.cwd == "/Users/dev/myproject"
         assert s.timestamp == "2025-06-15T10:30:00Z"
 
-    def test_skips_system_messages(self, sample_jsonl_session, claude_projects_dir):
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+    def test_skips_system_messages(self, sample_jsonl_session):
+        s = parse_session(self._session_for(sample_jsonl_session))
         for msg in s.messages:
             assert msg.role in ("user", "assistant")
 
-    def test_max_messages(self, sample_jsonl_session, claude_projects_dir):
-        sessions = discover_sessions()
-        s = parse_session(sessions[0], max_messages=2)
+    def test_max_messages(self, sample_jsonl_session):
+        s = parse_session(self._session_for(sample_jsonl_session), max_messages=2)
         assert len(s.messages) == 2
 
-    def test_bad_json_lines_skipped(self, claude_projects_dir):
-        proj = claude_projects_dir / "proj"
-        proj.mkdir()
-        f = proj / "bad.jsonl"
+    def test_bad_json_lines_skipped(self, tmp_path):
+        f = tmp_path / "bad.jsonl"
         f.write_text("not json\n{bad\n")
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+        s = parse_session(self._session_for(f))
         assert len(s.messages) == 0
 
-    def test_empty_lines_skipped(self, claude_projects_dir):
-        proj = claude_projects_dir / "proj"
-        proj.mkdir()
-        f = proj / "empty.jsonl"
+    def test_empty_lines_skipped(self, tmp_path):
+        f = tmp_path / "empty.jsonl"
         f.write_text("\n\n\n")
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+        s = parse_session(self._session_for(f))
         assert len(s.messages) == 0
 
-    def test_pure_tool_result_skipped(self, claude_projects_dir):
-        proj = claude_projects_dir / "proj"
-        proj.mkdir()
+    def test_pure_tool_result_skipped(self, tmp_path):
         entry = {
             "type": "assistant",
             "timestamp": "2025-01-01T00:00:00Z",
@@ -341,48 +363,39 @@ class TestParseSession:
                 ],
             },
         }
-        f = proj / "tr.jsonl"
+        f = tmp_path / "tr.jsonl"
         f.write_text(json.dumps(entry) + "\n")
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+        s = parse_session(self._session_for(f))
         assert len(s.messages) == 0
 
-    def test_no_content_skipped(self, claude_projects_dir):
-        proj = claude_projects_dir / "proj"
-        proj.mkdir()
+    def test_no_content_skipped(self, tmp_path):
         entry = {
             "type": "user",
             "timestamp": "2025-01-01T00:00:00Z",
             "message": {"role": "user"},
         }
-        f = proj / "nc.jsonl"
+        f = tmp_path / "nc.jsonl"
         f.write_text(json.dumps(entry) + "\n")
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+        s = parse_session(self._session_for(f))
         assert len(s.messages) == 0
 
-    def test_empty_text_skipped(self, claude_projects_dir):
-        proj = claude_projects_dir / "proj"
-        proj.mkdir()
+    def test_empty_text_skipped(self, tmp_path):
         entry = {
             "type": "user",
             "timestamp": "2025-01-01T00:00:00Z",
             "message": {"role": "user", "content": "   "},
         }
-        f = proj / "ws.jsonl"
+        f = tmp_path / "ws.jsonl"
         f.write_text(json.dumps(entry) + "\n")
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+        s = parse_session(self._session_for(f))
         assert len(s.messages) == 0
 
-    def test_first_timestamp_captured(self, sample_jsonl_session, claude_projects_dir):
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+    def test_first_timestamp_captured(self, sample_jsonl_session):
+        s = parse_session(self._session_for(sample_jsonl_session))
         assert s.timestamp.startswith("2025-06-15")
 
-    def test_message_roles(self, sample_jsonl_session, claude_projects_dir):
-        sessions = discover_sessions()
-        s = parse_session(sessions[0])
+    def test_message_roles(self, sample_jsonl_session):
+        s = parse_session(self._session_for(sample_jsonl_session))
         roles = [m.role for m in s.messages]
         assert "user" in roles
         assert "assistant" in roles
@@ -392,49 +405,65 @@ class TestParseSession:
 
 
 class TestSessionLabel:
-    def test_label_with_all_parts(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="-Users-dev-project",
-            timestamp="2025-06-15T10:30:00Z",
-            messages=[Message(role="user", text="Help me refactor auth", timestamp="")],
-        )
-        label = s.label
-        assert "2025-06-15" in label
-        assert "Users/dev/project" in label
-        assert "Help me refactor auth" in label
-
-    def test_label_no_messages(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="-Users-dev-project",
-            timestamp="2025-06-15T10:30:00Z",
-        )
-        label = s.label
-        assert "Users/dev/project" in label
-        assert '"' not in label
-
-    def test_label_no_timestamp(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="-Users-dev-project",
-            messages=[Message(role="user", text="Hello", timestamp="")],
-        )
-        label = s.label
-        assert "Hello" in label
-
-    def test_label_truncates_long_message(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="proj",
-            messages=[Message(role="user", text="x" * 100, timestamp="")],
-        )
-        label = s.label
-        assert "..." in label
+    @pytest.mark.parametrize(
+        "kwargs, present, absent",
+        [
+            (
+                {
+                    "project": "-Users-dev-project",
+                    "timestamp": "2025-06-15T10:30:00Z",
+                    "messages": [Message(role="user", text="Help me refactor auth", timestamp="")],
+                },
+                ["2025-06-15", "Users/dev/project", "Help me refactor auth"],
+                [],
+            ),
+            (
+                {"project": "-Users-dev-project", "timestamp": "2025-06-15T10:30:00Z"},
+                ["Users/dev/project"],
+                ['"'],
+            ),
+            (
+                {
+                    "project": "-Users-dev-project",
+                    "messages": [Message(role="user", text="Hello", timestamp="")],
+                },
+                ["Hello"],
+                [],
+            ),
+            (
+                {"project": "proj", "messages": [Message(role="user", text="x" * 100, timestamp="")]},
+                ["..."],
+                [],
+            ),
+            (
+                {"project": "proj", "timestamp": "not-a-date"},
+                ["not-a-date"],
+                [],
+            ),
+            (
+                {
+                    "project": "proj",
+                    "messages": [Message(role="user", text="line1\nline2\nline3", timestamp="")],
+                },
+                [],
+                ["\n"],
+            ),
+        ],
+        ids=[
+            "all_parts",
+            "no_messages",
+            "no_timestamp",
+            "truncates_long_message",
+            "bad_timestamp",
+            "newlines_removed",
+        ],
+    )
+    def test_label(self, kwargs, present, absent):
+        s = Session(session_id="abc12345", path=Path("/tmp/s.jsonl"), **kwargs)
+        for needle in present:
+            assert needle in s.label
+        for needle in absent:
+            assert needle not in s.label
 
     def test_label_fallback_to_id(self):
         s = Session(
@@ -442,27 +471,7 @@ class TestSessionLabel:
             path=Path("/tmp/s.jsonl"),
             project="",
         )
-        label = s.label
-        assert label == "abc12345-long-id"
-
-    def test_label_bad_timestamp(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="proj",
-            timestamp="not-a-date",
-        )
-        label = s.label
-        assert "not-a-date" in label
-
-    def test_label_newlines_removed(self):
-        s = Session(
-            session_id="abc12345",
-            path=Path("/tmp/s.jsonl"),
-            project="proj",
-            messages=[Message(role="user", text="line1\nline2\nline3", timestamp="")],
-        )
-        assert "\n" not in s.label
+        assert s.label == "abc12345-long-id"
 
 
 # -- format_transcript --
@@ -2,8 +2,6 @@
 
 import json
 
-import pytest
-
 from ai_lint.setup_hook import (
     HOOK_COMMAND_TTY,
     HOOK_ENTRY,
@@ -14,6 +12,13 @@ from ai_lint.setup_hook import (
     write_settings,
 )
 
+# Serialized once at import — tests write these verbatim.
+OTHER_HOOK = {"matcher": "", "hooks": [{"type": "command", "command": "echo done"}]}
+SETTINGS_WITH_HOOK = json.dumps({"hooks": {"SessionEnd": [HOOK_ENTRY]}}).encode()
+SETTINGS_WITH_OTHER_AND_HOOK = json.dumps(
+    {"hooks": {"SessionEnd": [OTHER_HOOK, HOOK_ENTRY]}}
+).encode()
+
 
 class TestReadSettings:
     def test_no_file(self, claude_settings_dir):
@@ -47,8 +52,7 @@ class TestIsHookInstalled:
         assert is_hook_installed() is False
 
     def test_installed(self, claude_settings_dir):
-        settings = {"hooks": {"SessionEnd": [HOOK_ENTRY]}}
-        claude_settings_dir.write_text(json.dumps(settings))
+        claude_settings_dir.write_bytes(SETTINGS_WITH_HOOK)
         assert is_hook_installed() is True
 
     def test_other_hooks_only(self, claude_settings_dir):
@@ -79,8 +83,7 @@ class TestInstallHook:
         assert "Updated" in captured.out
 
     def test_preserves_other_hooks(self, claude_settings_dir):
-        other_hook = {"matcher": "", "hooks": [{"type": "command", "command": "echo done"}]}
-        settings = {"hooks": {"SessionEnd": [other_hook], "PreTool": [{"matcher": "Bash"}]}}
+        settings = {"hooks": {"SessionEnd": [OTHER_HOOK], "PreTool": [{"matcher": "Bash"}]}}
         claude_settings_dir.write_text(json.dumps(settings))
         install_hook()
         data = json.loads(claude_settings_dir.read_text())
@@ -103,9 +106,7 @@ class TestUninstallHook:
         assert "not installed" in captured.out
 
     def test_preserves_other_hooks_on_uninstall(self, claude_settings_dir):
-        other_hook = {"matcher": "", "hooks": [{"type": "command", "command": "echo done"}]}
-        settings = {"hooks": {"SessionEnd": [other_hook, HOOK_ENTRY]}}
-        claude_settings_dir.write_text(json.dumps(settings))
+        claude_settings_dir.write_bytes(SETTINGS_WITH_OTHER_AND_HOOK)
         uninstall_hook()
         data = json.loads(claude_settings_dir.read_text())
         assert len(data["hooks"]["SessionEnd"]) == 1